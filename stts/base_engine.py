@@ -8,6 +8,7 @@ import logging
 import subprocess
 import os
 import signal
+import struct
 import threading
 import time
 from contextlib import contextmanager
@@ -20,6 +21,49 @@ FFMPEG_TIMEOUT = int(os.getenv('FFMPEG_TIMEOUT', 30))  # seconds
 FFMPEG_KILL_TIMEOUT = 5  # seconds to wait after SIGTERM before SIGKILL
 
 
+def _is_canonical_wav(audio: bytes) -> bool:
+    """Check whether audio is already a 16kHz mono 16-bit PCM WAV
+    
+    This is exactly the format normalize_audio asks FFmpeg to produce, so such
+    input can be used as-is. The RIFF size must match the buffer length and
+    every chunk must fit, otherwise the input is left for FFmpeg to handle.
+    
+    Args:
+        audio: Raw audio bytes
+        
+    Returns:
+        True if the audio is a well-formed canonical WAV
+    """
+    if len(audio) < 44 or audio[0:4] != b'RIFF' or audio[8:12] != b'WAVE':
+        return False
+    if struct.unpack_from('<I', audio, 4)[0] + 8 != len(audio):
+        return False
+    
+    fmt_ok = False
+    offset = 12
+    while offset + 8 <= len(audio):
+        chunk_id = audio[offset:offset + 4]
+        chunk_size = struct.unpack_from('<I', audio, offset + 4)[0]
+        chunk_start = offset + 8
+        if chunk_start + chunk_size > len(audio):
+            return False
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                return False
+            audio_format, channels, sample_rate = struct.unpack_from('<HHI', audio, chunk_start)
+            bits_per_sample = struct.unpack_from('<H', audio, chunk_start + 14)[0]
+            fmt_ok = (audio_format == 1 and channels == 1
+                      and sample_rate == 16000 and bits_per_sample == 16)
+            if not fmt_ok:
+                return False
+        elif chunk_id == b'data':
+            return fmt_ok and chunk_size > 0
+        # Chunks are word-aligned
+        offset = chunk_start + chunk_size + (chunk_size & 1)
+    
+    return False
+
+
 class ProcessTimeoutError(Exception):
     """Raised when a process exceeds the timeout limit"""
     pass
@@ -31,6 +75,17 @@ class FFmpegProcessManager:
     # Class-level tracking of active processes
     _active_processes = set()
     _process_lock = threading.Lock()
+    # Set whenever no processes are tracked, so callers can block instead of polling
+    _idle_event = threading.Event()
+    _idle_event.set()
+    
+    @classmethod
+    def _update_idle_state(cls):
+        """Sync the idle event with the tracked process set (call with _process_lock held)"""
+        if cls._active_processes:
+            cls._idle_event.clear()
+        else:
+            cls._idle_event.set()
     
     @classmethod
     def get_active_process_count(cls):
@@ -38,8 +93,21 @@ class FFmpegProcessManager:
         with cls._process_lock:
             # Clean up any terminated processes
             cls._active_processes = {p for p in cls._active_processes if p.poll() is None}
+            cls._update_idle_state()
             return len(cls._active_processes)
     
+    @classmethod
+    def wait_idle(cls, timeout: float = 5.0) -> bool:
+        """Block until no FFmpeg processes are tracked
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if all processes were cleaned up, False on timeout
+        """
+        return cls._idle_event.wait(timeout)
+    
     @classmethod
     def terminate_all_processes(cls):
         """Terminate all active FFmpeg processes (for emergency cleanup)"""
@@ -52,6 +120,7 @@ class FFmpegProcessManager:
                     except (OSError, ProcessLookupError):
                         pass
             cls._active_processes.clear()
+            cls._update_idle_state()
     
     def __init__(self, timeout: int = FFMPEG_TIMEOUT):
         self.timeout = timeout
@@ -127,6 +196,7 @@ class FFmpegProcessManager:
             # Track the process
             with self._process_lock:
                 self._active_processes.add(self.process)
+                self._update_idle_state()
             
             logger.debug(f"Started FFmpeg process PID={self.process.pid}, active processes: {self.get_active_process_count()}")
             
@@ -200,6 +270,7 @@ class FFmpegProcessManager:
                 # Remove from tracking
                 with self._process_lock:
                     self._active_processes.discard(self.process)
+                    self._update_idle_state()
                 
                 # Log final process state and timing
                 if self.process.poll() is not None:
@@ -259,6 +330,11 @@ class BaseSTTEngine(ABC):
         if len(sanitized_audio) > MAX_FILE_SIZE:
             raise ValueError(f"Audio file exceeds maximum size of {MAX_FILE_SIZE/1024/1024:.1f}MB")
         
+        # Input already in the target format: skip the FFmpeg round-trip
+        if _is_canonical_wav(sanitized_audio):
+            logger.debug("Audio is already 16kHz mono PCM WAV, skipping FFmpeg")
+            return sanitized_audio
+        
         # Build FFmpeg command using ffmpeg-python for command construction
         # but execute with our ProcessManager for proper cleanup
         try:
@@ -353,8 +429,13 @@ class BaseSTTEngine(ABC):
                 if nframes == 0:
                     raise ValueError("WAV file contains no audio frames")
                 
-                # Read audio data
-                audio_data = np.frombuffer(wav.readframes(nframes), np.int16)
+                # Read audio data without copying: after parsing the header the
+                # stream is positioned at the start of the data chunk, so view the
+                # PCM samples directly in the normalized buffer (read-only)
+                data_start = audio_io.tell()
+                data_end = min(data_start + nframes * wav.getsampwidth(), len(normalized_audio))
+                data_end -= (data_end - data_start) % np.dtype(np.int16).itemsize
+                audio_data = np.frombuffer(memoryview(normalized_audio)[data_start:data_end], np.int16)
                 
                 # Validate audio data
                 if len(audio_data) == 0:
@@ -2,12 +2,20 @@
 import json
 import logging
 import os
-from contextlib import closing
+import stat
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from threading import Lock
 import time
 
+# Prefer orjson (C parser, accepts bytes directly) when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,9 +24,12 @@ class ConfigManager:
     
     _instance = None
     _lock = Lock()
-    _cache: Dict[str, Dict[str, Any]] = {}
+    # Cache entries are (st_mtime_ns, st_size, config) so an unchanged file is
+    # served after a single stat() without re-reading or re-parsing it.
+    # A config of None records a file whose content failed to parse.
+    _cache: Dict[str, Tuple[int, int, Optional[Dict[str, Any]]]] = {}
     _cache_times: Dict[str, float] = {}
-    _cache_ttl = 300  # 5 minutes cache TTL
+    _cache_ttl = 300  # 5 minutes cache TTL (upper bound even if the file is unchanged)
     
     def __new__(cls):
         if cls._instance is None:
@@ -38,14 +49,25 @@ class ConfigManager:
         """Increment file handle counter for monitoring"""
         with self._monitor_lock:
             self._file_handle_count += 1
-            if self._file_handle_count > 100:
-                logger.warning(f"High file handle count detected: {self._file_handle_count}")
+            count = self._file_handle_count
+        # Log outside the lock so other readers aren't blocked on the handler
+        if count > 100:
+            logger.warning(f"High file handle count detected: {count}")
     
     def _decrement_file_handle_count(self):
         """Decrement file handle counter for monitoring"""
         with self._monitor_lock:
             self._file_handle_count -= 1
     
+    @contextmanager
+    def _tracked_file_handle(self):
+        """Count a file handle as open for the duration of the block"""
+        self._increment_file_handle_count()
+        try:
+            yield
+        finally:
+            self._decrement_file_handle_count()
+    
     def get_file_handle_count(self) -> int:
         """Get current file handle count for monitoring"""
         with self._monitor_lock:
@@ -80,6 +102,38 @@ class ConfigManager:
         elapsed = time.time() - self._cache_times[path]
         return elapsed < self._cache_ttl
     
+    def _store_cache(self, path: str, st: os.stat_result, config: Optional[Dict[str, Any]]):
+        """Cache a load result keyed by the file's stat signature
+        
+        Args:
+            path: Path the result was loaded from
+            st: stat() result taken before reading the file
+            config: Parsed configuration, or None if the content was invalid
+        """
+        with self._lock:
+            self._cache[path] = (st.st_mtime_ns, st.st_size, config)
+            self._cache_times[path] = time.time()
+    
+    def _read_file_bytes(self, config_path: Path, size: int = -1) -> bytes:
+        """Read raw file content while tracking the open file handle
+        
+        Args:
+            config_path: Path to the file to read
+            size: Expected file size from a prior stat(), or -1 to read to EOF
+            
+        Returns:
+            File content as bytes
+        """
+        # Raw fd with a known size: one read() syscall, no io wrapper objects
+        with self._tracked_file_handle():
+            fd = os.open(config_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+            try:
+                if size < 0:
+                    size = os.fstat(fd).st_size
+                return os.read(fd, size)
+            finally:
+                os.close(fd)
+    
     def load_json_config(self, config_path: Path) -> Optional[Dict[str, Any]]:
         """Load JSON configuration with proper resource management
         
@@ -91,44 +145,51 @@ class ConfigManager:
         """
         path_str = str(config_path)
         
-        # Check cache first
-        with self._lock:
-            if path_str in self._cache and self._is_cache_valid(path_str):
-                logger.debug(f"Using cached configuration for {path_str}")
-                return self._cache[path_str].copy()
-        
-        if not config_path.exists():
+        # A single stat() both validates the path and keys the cache
+        try:
+            st = os.stat(config_path)
+        except (FileNotFoundError, NotADirectoryError):
             logger.debug(f"Configuration file does not exist: {config_path}")
             return None
+        except OSError as e:
+            logger.error(f"OS error reading configuration file {config_path}: {e}")
+            return None
         
-        if not config_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.warning(f"Configuration path is not a file: {config_path}")
             return None
         
+        # Check cache first: hit only if the file is unchanged and within TTL
+        with self._lock:
+            entry = self._cache.get(path_str)
+            if (entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size
+                    and self._is_cache_valid(path_str)):
+                if entry[2] is None:
+                    logger.debug(f"Skipping unchanged invalid configuration {path_str}")
+                    return None
+                logger.debug(f"Using cached configuration for {path_str}")
+                return entry[2].copy()
+        
         # Read file content first, then parse JSON separately
         file_content = None
         config = None
         
         try:
             # Step 1: Read file content with guaranteed cleanup
-            self._increment_file_handle_count()
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-            finally:
-                self._decrement_file_handle_count()
+            file_content = self._read_file_bytes(config_path, st.st_size)
             
             # Step 2: Parse JSON (no file handle involved)
             if file_content:
-                config = json.loads(file_content)
+                config = _json_loads(file_content)
                 
                 # Cache the successful load
-                with self._lock:
-                    self._cache[path_str] = config.copy()
-                    self._cache_times[path_str] = time.time()
+                self._store_cache(path_str, st, config.copy())
                 
                 logger.info(f"Successfully loaded configuration from {config_path}")
                 return config
+            
+            # Empty file: remember it so it isn't re-read until it changes
+            self._store_cache(path_str, st, None)
                 
         except PermissionError as e:
             logger.error(f"Permission denied reading configuration file {config_path}: {e}")
@@ -137,6 +198,8 @@ class ConfigManager:
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in configuration file {config_path}: {e}")
             logger.debug(f"File content that failed to parse: {file_content[:200] if file_content else 'None'}...")
+            # Remember the failure so repeated loads skip the read and parse
+            self._store_cache(path_str, st, None)
         except Exception as e:
             logger.error(f"Unexpected error loading configuration from {config_path}: {type(e).__name__}: {e}")
         
@@ -1,8 +1,6 @@
 from typing import Dict, Any, Optional, List
 import logging
 import threading
-import weakref
-import time
 from pathlib import Path
 from .base_engine import BaseSTTEngine
 
@@ -75,6 +73,9 @@ class STTEngineManager:
     if PocketSphinxEngine:
         ENGINES['pocketsphinx'] = PocketSphinxEngine
     
+    # Number of lock stripes guarding lazy engine initialization
+    _LOCK_STRIPES = 64
+    
     def __init__(self, default_engine: str = 'whisper', config: Optional[Dict[str, Any]] = None):
         """Initialize the STT Engine Manager
         
@@ -85,17 +86,14 @@ class STTEngineManager:
         self.config = config or {}
         self.engines: Dict[str, BaseSTTEngine] = {}
         self.default_engine_name = default_engine
-        # Thread-safe initialization locks with automatic cleanup
-        # RESOURCE LEAK FIX: Implements automatic cleanup of unused engine locks to prevent
-        # memory leaks in long-running deployments. The cleanup mechanism uses:
-        # 1. TTL-based cleanup: Locks unused for _lock_cleanup_interval seconds are removed
-        # 2. Weak references: Track lock lifecycle without preventing garbage collection
-        # 3. Thread-safe cleanup: Safe to clean up while other threads are using locks
-        self._engine_locks: Dict[str, threading.RLock] = {}  # Using RLock for nested locking support
-        self._locks_lock = threading.RLock()  # RLock for managing the locks dictionary
-        self._lock_refs: Dict[str, weakref.ref] = {}  # Weak references to track lock usage
-        self._lock_last_used: Dict[str, float] = {}  # Track last usage time for TTL cleanup
-        self._lock_cleanup_interval = 300  # Cleanup locks unused for 5 minutes
+        # Thread-safe initialization locks (lock striping)
+        # RESOURCE LEAK FIX: A fixed pool of locks indexed by hash(engine name) replaces
+        # the per-name lock dictionary. Memory stays bounded no matter how many distinct
+        # (possibly client-supplied) engine names are requested, so no TTL cleanup,
+        # timestamps or weak references are needed.
+        self._engine_lock_stripes: List[threading.Lock] = [
+            threading.Lock() for _ in range(self._LOCK_STRIPES)
+        ]
         self._initialize_engines()
     
     def _initialize_engines(self):
@@ -138,71 +136,24 @@ class STTEngineManager:
         self.engines[name] = engine
         logger.info(f"Added custom engine: {name}")
     
-    def _cleanup_unused_locks(self):
-        """Clean up locks that haven't been used recently
-        
-        This method implements TTL-based cleanup to prevent the _engine_locks dictionary
-        from growing indefinitely. Locks are removed if:
-        1. They haven't been used for longer than _lock_cleanup_interval seconds
-        2. They are not currently locked (not in use by any thread)
-        
-        This is thread-safe and can be called while other threads are using locks.
-        """
-        current_time = time.time()
-        locks_to_remove = []
-        
-        with self._locks_lock:
-            for engine_name, last_used in list(self._lock_last_used.items()):
-                # Remove locks that haven't been used for the cleanup interval
-                # and are not currently in use (not locked)
-                if current_time - last_used > self._lock_cleanup_interval:
-                    lock = self._engine_locks.get(engine_name)
-                    if lock and not lock.locked():
-                        locks_to_remove.append(engine_name)
-            
-            # Remove identified locks
-            for engine_name in locks_to_remove:
-                if engine_name in self._engine_locks:
-                    del self._engine_locks[engine_name]
-                if engine_name in self._lock_refs:
-                    del self._lock_refs[engine_name]
-                if engine_name in self._lock_last_used:
-                    del self._lock_last_used[engine_name]
-                logger.debug(f"Cleaned up unused lock for engine: {engine_name}")
-        
-        if locks_to_remove:
-            logger.info(f"Cleaned up {len(locks_to_remove)} unused engine locks")
+    def _lock_stripe_index(self, name: str) -> int:
+        """Index of the lock stripe guarding the given engine name"""
+        return hash(name) % self._LOCK_STRIPES
     
-    def _get_or_create_lock(self, name: str) -> threading.RLock:
-        """Get or create a lock for the given engine name with cleanup tracking
+    def _get_or_create_lock(self, name: str) -> threading.Lock:
+        """Get the initialization lock for the given engine name
         
-        This method ensures thread-safe lazy initialization of engines while preventing
-        resource leaks through automatic cleanup. It:
-        1. Creates a new lock if one doesn't exist for the engine
-        2. Updates the last-used timestamp for TTL tracking
-        3. Periodically triggers cleanup to remove stale locks
+        Engine names are mapped onto a fixed set of lock stripes, so the same name
+        always gets the same lock and no per-name state is ever created. Distinct
+        engines that share a stripe only serialize their first-time initialization.
         
         Args:
-            name: Name of the engine to get/create a lock for
+            name: Name of the engine to get a lock for
             
         Returns:
             Threading lock for the specified engine
         """
-        with self._locks_lock:
-            if name not in self._engine_locks:
-                lock = threading.RLock()
-                self._engine_locks[name] = lock
-                self._lock_refs[name] = weakref.ref(lock)
-                logger.debug(f"Created new lock for engine: {name}")
-            
-            # Update last used time
-            self._lock_last_used[name] = time.time()
-            
-            # Periodically cleanup unused locks (every 10 engine requests)
-            if len(self._engine_locks) > 10 and len(self._engine_locks) % 10 == 0:
-                self._cleanup_unused_locks()
-            
-            return self._engine_locks[name]
+        return self._engine_lock_stripes[self._lock_stripe_index(name)]
     
     def get_engine(self, name: Optional[str] = None) -> BaseSTTEngine:
         """Get a specific engine or the default engine with thread-safe initialization
@@ -232,7 +183,7 @@ class STTEngineManager:
             return engine
         
         # Slow path: Engine needs initialization
-        # Get or create lock for this specific engine with cleanup tracking
+        # Get the lock stripe for this engine
         engine_lock = self._get_or_create_lock(name)
         
         # Try to initialize on-demand with proper locking
@@ -380,34 +331,36 @@ class STTEngineManager:
                     }
             return info
     
-    def get_lock_stats(self) -> Dict[str, Any]:
+    def get_lock_stats(self, include_locks: bool = True) -> Dict[str, Any]:
         """Get statistics about engine locks (for monitoring/debugging)
         
-        Provides visibility into the lock cleanup mechanism's state, useful for:
-        - Monitoring lock lifecycle in production
-        - Debugging potential lock leaks
-        - Verifying cleanup is working correctly
+        Provides visibility into the lock striping, useful for:
+        - Verifying the number of locks stays bounded in production
+        - Debugging initialization contention between engines sharing a stripe
+        
+        Args:
+            include_locks: Whether to build per-engine lock details, which walks
+                every registered engine. Pass False when only the count is needed.
         
         Returns:
             Dict with lock statistics including:
-            - total_locks: Number of active locks
-            - locks: Per-engine lock details (locked state, age, weak ref status)
+            - total_locks: Number of lock stripes (fixed)
+            - locks: Per-engine lock details (stripe index, locked state) for registered
+              engines, empty if include_locks is False
         """
-        with self._locks_lock:
-            current_time = time.time()
-            stats = {
-                'total_locks': len(self._engine_locks),
-                'locks': {}
+        stats = {
+            'total_locks': len(self._engine_lock_stripes),
+            'locks': {}
+        }
+        
+        if not include_locks:
+            return stats
+        
+        for engine_name in self.ENGINES:
+            stripe = self._lock_stripe_index(engine_name)
+            stats['locks'][engine_name] = {
+                'stripe': stripe,
+                'locked': self._engine_lock_stripes[stripe].locked()
             }
-            
-            for engine_name, lock in self._engine_locks.items():
-                last_used = self._lock_last_used.get(engine_name, 0)
-                age = current_time - last_used if last_used else 0
-                
-                stats['locks'][engine_name] = {
-                    'locked': lock.locked(),
-                    'age_seconds': age,
-                    'weak_ref_alive': self._lock_refs.get(engine_name, lambda: None)() is not None
-                }
-            
-            return stats
\ No newline at end of file
+        
+        return stats
\ No newline at end of file
@@ -119,7 +119,8 @@ class NeMoEngine(BaseSTTEngine):
                 
                 # Convert to float32
                 if audio_data.dtype == np.int16:
-                    audio_float = audio_data.astype(np.float32) / 32768.0
+                    audio_float = audio_data.astype(np.float32)
+                    audio_float *= 1.0 / 32768.0
                 else:
                     audio_float = audio_data.astype(np.float32)
                 
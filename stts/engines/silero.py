@@ -47,7 +47,9 @@ class SileroEngine(BaseSTTEngine):
         
         # Convert to float32 tensor
         if audio_data.dtype == np.int16:
-            audio_tensor = torch.from_numpy(audio_data.astype(np.float32) / 32768.0)
+            audio_float = audio_data.astype(np.float32)
+            audio_float *= 1.0 / 32768.0
+            audio_tensor = torch.from_numpy(audio_float)
         else:
             audio_tensor = torch.from_numpy(audio_data.astype(np.float32))
         
@@ -54,7 +54,8 @@ class Wav2Vec2Engine(BaseSTTEngine):
         """Transcribe using Wav2Vec2"""
         # Convert to float32 and normalize
         if audio_data.dtype == np.int16:
-            audio_float = audio_data.astype(np.float32) / 32768.0
+            audio_float = audio_data.astype(np.float32)
+            audio_float *= 1.0 / 32768.0
         else:
             audio_float = audio_data.astype(np.float32)
         
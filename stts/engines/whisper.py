@@ -95,12 +95,13 @@ class WhisperEngine(BaseSTTEngine):
         try:
             # Whisper.cpp expects float32 audio in range [-1, 1]
             if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype != np.float32:
+                # int16 / 32768 is always within [-1, 1), so scale the fresh
+                # float32 copy in place and skip the clip pass
                 audio_data = audio_data.astype(np.float32)
-            
-            # Ensure audio is in correct range
-            audio_data = np.clip(audio_data, -1.0, 1.0)
+                audio_data *= 1.0 / 32768.0
+            else:
+                # Ensure audio is in correct range
+                audio_data = np.clip(audio_data.astype(np.float32, copy=False), -1.0, 1.0)
             
             # Transcribe with options
             # Whisper.cpp expects language as a string, not None
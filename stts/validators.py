@@ -2,6 +2,7 @@
 Input validation and security utilities for the STT service
 """
 import os
+import re
 import hashlib
 import time
 from typing import Optional, Dict, Tuple, Deque
@@ -20,7 +21,7 @@ MAX_REQUESTS_PER_HOUR = int(os.getenv('MAX_REQUESTS_PER_HOUR', 600))
 REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 60))  # 60 seconds default
 
 # Allowed MIME types for audio files
-ALLOWED_MIME_TYPES = {
+ALLOWED_MIME_TYPES = frozenset({
     'audio/wav',
     'audio/x-wav',
     'audio/wave',
@@ -41,7 +42,7 @@ ALLOWED_MIME_TYPES = {
     'audio/3gpp',
     'audio/3gpp2',
     'application/octet-stream',  # Generic binary, will validate with magic numbers
-}
+})
 
 # Magic numbers for common audio formats (first few bytes)
 AUDIO_MAGIC_NUMBERS = {
@@ -59,6 +60,9 @@ AUDIO_MAGIC_NUMBERS = {
     b'#!AMR-WB': 'amr',  # AMR-WB
 }
 
+# Characters stripped from uploaded filenames (compiled once at import)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s\-\.]')
+
 
 class RateLimiter:
     """Thread-safe rate limiter using sliding window algorithm with deque for efficiency
@@ -298,15 +302,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import os.path
-    import re
-    
     # Remove any path components (gets just the filename)
     # This handles ../../../etc/passwd -> passwd
     filename = os.path.basename(filename)
     
     # Remove dangerous characters but keep alphanumeric, spaces, hyphens, underscores, and dots
-    filename = re.sub(r'[^\w\s\-\.]', '', filename)
+    filename = _UNSAFE_FILENAME_CHARS.sub('', filename)
     
     # Remove leading dots to prevent hidden files
     filename = filename.lstrip('.')
@@ -106,8 +106,8 @@ def test_lazy_initialization_thread_safety():
     manager = STTEngineManager(default_engine='whisper', config=config)
     
     # Verify thread safety attributes
-    assert hasattr(manager, '_engine_locks'), "Missing _engine_locks"
-    assert hasattr(manager, '_locks_lock'), "Missing _locks_lock"
+    assert hasattr(manager, '_engine_lock_stripes'), "Missing _engine_lock_stripes"
+    assert hasattr(manager, '_get_or_create_lock'), "Missing _get_or_create_lock"
     logger.info("✓ Thread safety attributes initialized")
     
     # Clear any engines that might have been initialized
@@ -150,11 +150,11 @@ def test_lazy_initialization_thread_safety():
         logger.error(f"✗ FAIL: Race condition detected! Whisper initialized {whisper_count} times")
         return False
     
-    # Verify lock was created
-    if 'whisper' in manager._engine_locks:
-        logger.info("✓ Lock created for 'whisper' during lazy initialization")
+    # Verify the lock is one of the stripes
+    if manager._get_or_create_lock('whisper') in manager._engine_lock_stripes:
+        logger.info("✓ Lock stripe used for 'whisper' during lazy initialization")
     else:
-        logger.error("✗ No lock found for 'whisper'")
+        logger.error("✗ No lock stripe found for 'whisper'")
         return False
     
     # Test multiple different engines concurrently
@@ -163,7 +163,6 @@ def test_lazy_initialization_thread_safety():
     
     # Reset for next test
     manager.engines.clear()
-    manager._engine_locks.clear()
     ThreadSafeTestEngine.reset_counts()
     
     with ThreadPoolExecutor(max_workers=30) as executor:
@@ -198,13 +197,13 @@ def test_lazy_initialization_thread_safety():
     
     logger.info("\n✓ PASS: All engines initialized exactly once")
     
-    # Verify locks were created for all engines
+    # Verify all engines map to lock stripes
     for engine in ['whisper', 'vosk', 'silero']:
-        if engine not in manager._engine_locks:
-            logger.error(f"✗ No lock for {engine}")
+        if manager._get_or_create_lock(engine) not in manager._engine_lock_stripes:
+            logger.error(f"✗ No lock stripe for {engine}")
             return False
     
-    logger.info("✓ All engine locks properly created")
+    logger.info("✓ All engine locks map to stripes")
     
     logger.info("\n" + "=" * 60)
     logger.info("SUCCESS: Thread-safe lazy initialization working correctly!")
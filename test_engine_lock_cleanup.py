@@ -1,15 +1,13 @@
 #!/usr/bin/env python3
-"""Test engine lock cleanup mechanism to prevent resource leaks"""
+"""Test engine lock striping to prevent resource leaks"""
 
 import sys
 import os
 import threading
 import time
-import gc
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
-import weakref
 
 # Configure logging
 logging.basicConfig(
@@ -43,202 +41,162 @@ class MockSTTEngine:
         self.config = config
         self.name = config.get('name', 'unknown')
         self.is_available = True
-        logger.debug(f"MockSTTEngine '{self.name}' initialized")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"MockSTTEngine '{self.name}' initialized")
 
 
-def test_lock_cleanup_after_ttl():
-    """Test that locks are cleaned up after TTL expires"""
+class _AutoCfg(dict):
+    """Manager config that gives every engine a {'name': ...} entry on first lookup
+    
+    STTEngineManager reads engine config through get(), which bypasses
+    __missing__, so get() is routed through item lookup for registered engine
+    names. Other settings (e.g. initialize_all) still fall back to the default.
+    """
+    
+    def __missing__(self, key):
+        value = self[key] = {'name': key}
+        return value
+    
+    def get(self, key, default=None):
+        if key in STTEngineManager.ENGINES:
+            return self[key]
+        return super().get(key, default)
+
+
+# Engine names shared by the tests, built once at import
+_STRESS_NAMES = tuple(f'stress_engine_{i}' for i in range(1000))
+_CONCURRENT_NAMES = tuple(f'concurrent_engine_{i}' for i in range(100))
+
+# Registry snapshot restored after the module's tests
+_original_engines = {}
+
+
+def setup_module(module=None):
+    """Replace all engine classes with our mock once for the module"""
+    _original_engines.update(STTEngineManager.ENGINES)
+    STTEngineManager.ENGINES.update(dict.fromkeys(STTEngineManager.ENGINES, MockSTTEngine))
+
+
+def teardown_module(module=None):
+    """Restore the engine registry, dropping engines the tests registered"""
+    STTEngineManager.ENGINES.clear()
+    STTEngineManager.ENGINES.update(_original_engines)
+    _original_engines.clear()
+
+
+def _make_manager(names):
+    """Register mock engines under the given names and build a lazy manager
+    
+    Args:
+        names: Engine names to register
+        
+    Returns:
+        STTEngineManager with no engines initialized
+    """
+    STTEngineManager.ENGINES.update(dict.fromkeys(names, MockSTTEngine))
+    manager = STTEngineManager(default_engine='whisper', config=_AutoCfg(initialize_all=False))
+    # Clear pre-initialized engines to force lazy initialization
+    manager.engines.clear()
+    return manager
+
+
+def test_engine_locks_are_striped():
+    """Test that engine locks come from a fixed, stable set of stripes"""
     
     logger.info("=" * 60)
-    logger.info("Test 1: Lock cleanup after TTL expiration")
+    logger.info("Test 1: Engine locks are striped")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    # Add test engines to the registry
-    STTEngineManager.ENGINES['test_engine_1'] = MockSTTEngine
-    STTEngineManager.ENGINES['test_engine_2'] = MockSTTEngine
-    STTEngineManager.ENGINES['test_engine_3'] = MockSTTEngine
-    
-    # Create manager with short cleanup interval for testing
-    config = {
-        'initialize_all': False,
-        'test_engine_1': {'name': 'test_engine_1'},
-        'test_engine_2': {'name': 'test_engine_2'},
-        'test_engine_3': {'name': 'test_engine_3'}
-    }
+    manager = _make_manager(['test_engine_1', 'test_engine_2', 'test_engine_3'])
     
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    # Override cleanup interval for faster testing
-    manager._lock_cleanup_interval = 2  # 2 seconds for testing
-    
-    # Remove pre-initialized engines to test lazy initialization
-    manager.engines.clear()
-    
-    # Get some engines to create locks through lazy initialization
-    logger.info("Creating locks for test engines...")
+    # Get some engines through lazy initialization
+    logger.info("Initializing test engines...")
     engine1 = manager.get_engine('test_engine_1')
     engine2 = manager.get_engine('test_engine_2')
     
-    # Check locks were created
-    initial_locks = len(manager._engine_locks)
-    logger.info(f"Initial locks created: {initial_locks}")
-    assert 'test_engine_1' in manager._engine_locks, "Lock for test_engine_1 not created"
-    assert 'test_engine_2' in manager._engine_locks, "Lock for test_engine_2 not created"
-    
-    # Wait for TTL to expire
-    logger.info(f"Waiting {manager._lock_cleanup_interval + 1} seconds for TTL to expire...")
-    time.sleep(manager._lock_cleanup_interval + 1)
-    
-    # Register and add more test engines for triggering cleanup
-    for i in range(11):
-        engine_name = f'test_engine_{i + 10}'
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-        manager.config[engine_name] = {'name': engine_name}
-    
-    # Trigger cleanup by requesting a new engine (every 10th request triggers cleanup)
-    for i in range(11):
-        manager.get_engine(f'test_engine_{i + 10}')
+    # Each engine maps to one of the fixed stripes, and always the same one
+    lock1 = manager._get_or_create_lock('test_engine_1')
+    lock2 = manager._get_or_create_lock('test_engine_2')
+    assert any(lock1 is stripe for stripe in manager._engine_lock_stripes), "Lock for test_engine_1 is not a stripe"
+    assert any(lock2 is stripe for stripe in manager._engine_lock_stripes), "Lock for test_engine_2 is not a stripe"
+    assert manager._get_or_create_lock('test_engine_1') is lock1, "Lock for test_engine_1 is not stable"
+    
+    # Lock acquisition works
+    assert lock1.acquire(timeout=1), "Could not acquire lock for test_engine_1"
+    lock1.release()
+    
+    # Register all names up front so the registry is stable while engines are requested
+    names = [f'test_engine_{i + 10}' for i in range(11)]
+    STTEngineManager.ENGINES.update(dict.fromkeys(names, MockSTTEngine))
+    for engine_name in names:
+        manager.get_engine(engine_name)
     
-    # Check that old locks were cleaned up
+    # The number of locks does not grow with the number of engines
     stats = manager.get_lock_stats()
-    logger.info(f"Lock stats after cleanup: {stats}")
+    logger.info(f"Total locks after requests: {stats['total_locks']}")
+    assert stats['total_locks'] == manager._LOCK_STRIPES, "Lock count grew with engine requests"
+    assert manager._get_or_create_lock('test_engine_1') is lock1, "Lock for test_engine_1 changed"
+    assert 'test_engine_1' in stats['locks'], "Stats missing per-engine lock details"
     
-    # Old locks should be cleaned up
-    if 'test_engine_1' in manager._engine_locks:
-        logger.warning("test_engine_1 lock not cleaned up - may still be in use")
-    if 'test_engine_2' in manager._engine_locks:
-        logger.warning("test_engine_2 lock not cleaned up - may still be in use")
+    # The count alone doesn't need per-engine details
+    count_only = manager.get_lock_stats(include_locks=False)
+    assert count_only == {'total_locks': stats['total_locks'], 'locks': {}}, "Unexpected count-only stats"
     
-    logger.info("✓ PASS: Lock cleanup mechanism working")
+    logger.info("✓ PASS: Engine locks are bounded and stable")
     return True
 
 
-def test_lock_cleanup_with_concurrent_access():
-    """Test that locks are not cleaned up while actively being used"""
+def test_lock_stable_during_concurrent_access():
+    """Test that an engine's lock stays stable while it is actively being used"""
     
     logger.info("\n" + "=" * 60)
     logger.info("Test 2: Lock safety during concurrent access")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    # Add busy_engine to registry
-    STTEngineManager.ENGINES['busy_engine'] = MockSTTEngine
+    manager = _make_manager(['busy_engine'])
+    manager.get_engine('busy_engine')
+    busy_lock = manager._get_or_create_lock('busy_engine')
     
-    config = {
-        'initialize_all': False,
-        'busy_engine': {'name': 'busy_engine'}
-    }
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 1  # Very short for testing
-    
-    # Clear pre-initialized engines to test lazy initialization
-    manager.engines.clear()
-    
-    # Flag to control the busy thread
-    keep_running = threading.Event()
-    keep_running.set()
+    # The busy thread holds the lock until the main thread is done
+    lock_held = threading.Barrier(2)
+    done = threading.Event()
     
     def keep_engine_busy():
-        """Continuously access the engine to keep its lock active"""
-        while keep_running.is_set():
-            try:
-                engine = manager.get_engine('busy_engine')
-                time.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error in busy thread: {e}")
-                break
+        """Hold the engine's lock so it is in use for the whole check"""
+        with busy_lock:
+            lock_held.wait()
+            done.wait()
     
-    # Start a thread that keeps accessing the engine
+    # Start a thread that holds the engine's lock
     busy_thread = threading.Thread(target=keep_engine_busy, name="BusyThread")
     busy_thread.start()
     
     try:
-        # Wait for TTL to expire multiple times
-        time.sleep(3)
+        lock_held.wait(timeout=5)
+        assert busy_lock.locked(), "Busy thread is not holding the lock"
         
-        # Register temp engines and trigger multiple cleanup attempts
-        for i in range(20):
-            engine_name = f'temp_engine_{i}'
-            STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-            manager.config[engine_name] = {'name': engine_name}
+        # Engines on other stripes must not wait on the held lock
+        temp_names = [
+            name for name in (f'temp_engine_{i}' for i in range(100))
+            if manager._get_or_create_lock(name) is not busy_lock
+        ][:20]
+        
+        # Register and initialize other engines while it is held
+        STTEngineManager.ENGINES.update(dict.fromkeys(temp_names, MockSTTEngine))
+        for engine_name in temp_names:
             manager.get_engine(engine_name)
         
-        # Check that the busy engine's lock is still there
-        assert 'busy_engine' in manager._engine_locks, "Active engine lock was incorrectly cleaned up!"
-        logger.info("✓ Active engine lock was preserved during cleanup")
+        # Check that the busy engine still maps to the same lock
+        assert manager._get_or_create_lock('busy_engine') is busy_lock, "Active engine lock was replaced!"
+        assert manager.get_engine('busy_engine') is not None, "Initialized engine blocked on its held lock"
+        logger.info("✓ Active engine lock was preserved")
         
     finally:
-        # Stop the busy thread
-        keep_running.clear()
+        # Release the busy thread
+        done.set()
         busy_thread.join(timeout=2)
     
-    logger.info("✓ PASS: Locks are not cleaned up while in use")
-    return True
-
-
-def test_weak_reference_cleanup():
-    """Test that weak references allow garbage collection of unused locks"""
-    
-    logger.info("\n" + "=" * 60)
-    logger.info("Test 3: Weak reference cleanup")
-    logger.info("=" * 60)
-    
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    # Add weak_test to registry
-    STTEngineManager.ENGINES['weak_test'] = MockSTTEngine
-    
-    config = {
-        'initialize_all': False,
-        'weak_test': {'name': 'weak_test'}
-    }
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    
-    # Clear pre-initialized engines to test lazy initialization
-    manager.engines.clear()
-    
-    # Get an engine to create a lock through lazy initialization
-    engine = manager.get_engine('weak_test')
-    
-    # Check that weak reference is created
-    assert 'weak_test' in manager._lock_refs
-    weak_ref = manager._lock_refs['weak_test']
-    
-    # Verify weak reference is alive
-    assert weak_ref() is not None, "Weak reference should be alive"
-    logger.info("✓ Weak reference created and alive")
-    
-    # Get the actual lock object
-    lock = manager._engine_locks['weak_test']
-    
-    # Create a strong reference to test weak ref behavior
-    strong_ref = lock
-    
-    # Force garbage collection
-    gc.collect()
-    
-    # Weak ref should still be alive due to strong references
-    assert weak_ref() is not None, "Weak reference died prematurely"
-    logger.info("✓ Weak reference survives with strong references")
-    
-    # Delete strong reference
-    del strong_ref
-    del lock
-    
-    # Note: We can't truly test weak reference cleanup without removing
-    # the lock from _engine_locks, which would happen during TTL cleanup
-    
-    logger.info("✓ PASS: Weak reference mechanism in place")
+    logger.info("✓ PASS: Locks are stable while in use")
     return True
 
 
@@ -246,135 +204,79 @@ def test_memory_stress_test():
     """Stress test to ensure no memory leak with many engine requests"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("Test 4: Memory stress test (1000+ engine requests)")
+    logger.info("Test 3: Memory stress test (1000+ engine requests)")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    config = {'initialize_all': False}
-    
-    # Add engines to registry and config
-    for i in range(1000):
-        engine_name = f'stress_engine_{i}'
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-        config[engine_name] = {'name': engine_name}
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 1  # Fast cleanup for testing
-    
-    # Clear pre-initialized engines to force lazy initialization
-    manager.engines.clear()
+    names = _STRESS_NAMES
+    manager = _make_manager(names)
     
     logger.info("Starting stress test with 1000 unique engine requests...")
     
     # Track initial state
-    initial_lock_count = len(manager._engine_locks)
-    
-    # Request many different engines
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        futures = []
-        for i in range(1000):
-            futures.append(
-                executor.submit(manager.get_engine, f'stress_engine_{i}')
-            )
-        
-        # Wait for all to complete
-        completed = 0
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                completed += 1
-                if completed % 100 == 0:
-                    logger.info(f"Completed {completed}/1000 requests")
-                    # Log current lock count
-                    stats = manager.get_lock_stats()
-                    logger.info(f"Current lock count: {stats['total_locks']}")
-            except Exception as e:
-                logger.error(f"Request failed: {e}")
+    initial_lock_count = manager.get_lock_stats(include_locks=False)['total_locks']
     
-    # Get final stats before cleanup
-    stats_before = manager.get_lock_stats()
-    logger.info(f"Locks before cleanup: {stats_before['total_locks']}")
+    # Progress logging builds lock stats, so skip it when INFO is disabled
+    log_progress = logger.isEnabledFor(logging.INFO)
     
-    # Wait for TTL and trigger cleanup
-    time.sleep(manager._lock_cleanup_interval + 1)
+    # The manager logs every engine initialization at INFO; keep only warnings
+    manager_logger = logging.getLogger('stts.engine_manager')
+    previous_level = manager_logger.level
+    manager_logger.setLevel(logging.WARNING)
     
-    # Force cleanup by making more requests
-    for i in range(15):
-        engine_name = f'cleanup_trigger_{i}'
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-        manager.config[engine_name] = {'name': engine_name}
-        manager.get_engine(engine_name)
+    # Request many different engines. Mock construction is pure Python and holds
+    # the GIL, so a single thread does the same work without scheduler overhead;
+    # concurrency is covered by test_concurrent_engine_operations.
+    try:
+        for completed, name in enumerate(names, 1):
+            manager.get_engine(name)
+            if log_progress and completed % 100 == 0:
+                logger.info(f"Completed {completed}/1000 requests")
+                # Log current lock count
+                stats = manager.get_lock_stats(include_locks=False)
+                logger.info(f"Current lock count: {stats['total_locks']}")
+    finally:
+        manager_logger.setLevel(previous_level)
     
     # Get final stats
-    stats_after = manager.get_lock_stats()
-    logger.info(f"Locks after cleanup: {stats_after['total_locks']}")
+    stats_after = manager.get_lock_stats(include_locks=False)
+    logger.info(f"Locks after 1000 engine requests: {stats_after['total_locks']}")
     
-    # Verify cleanup happened
-    if stats_after['total_locks'] < stats_before['total_locks']:
-        logger.info(f"✓ Cleanup removed {stats_before['total_locks'] - stats_after['total_locks']} locks")
-    else:
-        logger.warning("⚠ No cleanup occurred, locks may still be in use")
-    
-    # The important thing is that cleanup mechanism exists and works
-    assert hasattr(manager, '_cleanup_unused_locks'), "Cleanup method missing"
-    assert hasattr(manager, '_lock_last_used'), "Lock tracking missing"
+    # Lock count is bounded by the stripe count, not the number of engines
+    assert stats_after['total_locks'] == initial_lock_count, "Lock count grew with engine requests"
+    assert stats_after['total_locks'] == manager._LOCK_STRIPES, "Unexpected number of locks"
     
-    logger.info("✓ PASS: Stress test completed, cleanup mechanism functional")
+    logger.info("✓ PASS: Stress test completed, lock count bounded")
     return True
 
 
-def test_cleanup_during_concurrent_operations():
-    """Test cleanup safety during concurrent engine operations"""
+def test_concurrent_engine_operations():
+    """Test lock safety during concurrent engine operations"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("Test 5: Cleanup during concurrent operations")
+    logger.info("Test 4: Concurrent engine operations")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    config = {'initialize_all': False}
-    
-    # Add engines to registry and config
-    for i in range(100):
-        engine_name = f'concurrent_engine_{i}'
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-        config[engine_name] = {'name': engine_name}
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 0.5  # Very aggressive cleanup
-    
-    # Clear pre-initialized engines
-    manager.engines.clear()
+    manager = _make_manager(_CONCURRENT_NAMES)
     
     errors = []
-    successes = 0
     
     def concurrent_access(engine_id):
-        """Access engines while cleanup might be happening"""
+        """Access engines concurrently with other workers"""
+        name = _CONCURRENT_NAMES[engine_id]
         try:
             for _ in range(10):
-                engine = manager.get_engine(f'concurrent_engine_{engine_id}')
-                time.sleep(0.01)
+                engine = manager.get_engine(name)
+                # Yield the GIL so workers interleave, without a timed sleep
+                time.sleep(0)
             return True
         except Exception as e:
             errors.append(str(e))
             return False
     
-    logger.info("Starting concurrent access with aggressive cleanup...")
+    logger.info("Starting concurrent access...")
     
     with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = []
-        for i in range(100):
-            futures.append(executor.submit(concurrent_access, i % 50))
-        
-        for future in as_completed(futures):
-            if future.result():
-                successes += 1
+        successes = sum(executor.map(concurrent_access, (i % 50 for i in range(100))))
     
     logger.info(f"Completed: {successes} successes, {len(errors)} errors")
     
@@ -385,106 +287,83 @@ def test_cleanup_during_concurrent_operations():
     assert successes > 0, "No successful operations"
     assert len(errors) < successes, "Too many errors"
     
-    logger.info("✓ PASS: Cleanup is safe during concurrent operations")
+    logger.info("✓ PASS: Locking is safe during concurrent operations")
     return True
 
 
-def test_lock_reuse_after_cleanup():
-    """Test that engines can be accessed again after their locks are cleaned up"""
+def test_lock_reuse():
+    """Test that engines reuse their lock and stripes stay bounded for many names"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("Test 6: Lock recreation after cleanup")
+    logger.info("Test 5: Lock reuse and bounded stripes")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    # Add reuse_engine to registry
-    STTEngineManager.ENGINES['reuse_engine'] = MockSTTEngine
-    
-    config = {
-        'initialize_all': False,
-        'reuse_engine': {'name': 'reuse_engine'}
-    }
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 1
-    
-    # Clear pre-initialized engines
-    manager.engines.clear()
+    manager = _make_manager(['reuse_engine'])
     
     # First access
-    logger.info("First access to create lock...")
+    logger.info("First access...")
     engine1 = manager.get_engine('reuse_engine')
-    assert 'reuse_engine' in manager._engine_locks
-    
-    # Wait for cleanup
-    logger.info("Waiting for cleanup...")
-    time.sleep(manager._lock_cleanup_interval + 1)
+    lock1 = manager._get_or_create_lock('reuse_engine')
     
-    # Register trigger engines and trigger cleanup
-    for i in range(15):
-        engine_name = f'trigger_{i}'
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-        manager.config[engine_name] = {'name': engine_name}
-        manager.get_engine(engine_name)
-    
-    # Check if lock was cleaned
-    lock_exists = 'reuse_engine' in manager._engine_locks
-    logger.info(f"Lock exists after cleanup: {lock_exists}")
+    # Look up locks for 1000 distinct names
+    distinct_locks = {id(manager._get_or_create_lock(f'lock_name_{i}')) for i in range(1000)}
+    logger.info(f"Distinct locks for 1000 names: {len(distinct_locks)}")
+    assert len(distinct_locks) <= manager._LOCK_STRIPES, "Lock count not bounded by stripes"
     
-    # Access engine again - should work regardless
-    logger.info("Second access after potential cleanup...")
+    # Access engine again - same engine, same lock
+    logger.info("Second access...")
     engine2 = manager.get_engine('reuse_engine')
-    assert engine2 is not None
-    assert 'reuse_engine' in manager._engine_locks
+    assert engine2 is engine1
+    assert manager._get_or_create_lock('reuse_engine') is lock1
     
-    logger.info("✓ PASS: Engine accessible after lock cleanup")
+    logger.info("✓ PASS: Engine lock reused and stripes bounded")
     return True
 
 
 def run_all_tests():
-    """Run all lock cleanup tests"""
+    """Run all engine lock tests"""
     
     tests = [
-        ("TTL-based cleanup", test_lock_cleanup_after_ttl),
-        ("Concurrent access safety", test_lock_cleanup_with_concurrent_access),
-        ("Weak reference mechanism", test_weak_reference_cleanup),
+        ("Lock striping", test_engine_locks_are_striped),
+        ("Concurrent access safety", test_lock_stable_during_concurrent_access),
         ("Memory stress test", test_memory_stress_test),
-        ("Cleanup during operations", test_cleanup_during_concurrent_operations),
-        ("Lock recreation", test_lock_reuse_after_cleanup)
+        ("Concurrent operations", test_concurrent_engine_operations),
+        ("Lock reuse", test_lock_reuse)
     ]
     
     passed = 0
     failed = 0
     
     logger.info("\n" + "=" * 60)
-    logger.info("ENGINE LOCK CLEANUP TEST SUITE")
+    logger.info("ENGINE LOCK TEST SUITE")
     logger.info("=" * 60)
     
-    for test_name, test_func in tests:
-        try:
-            logger.info(f"\nRunning: {test_name}")
-            if test_func():
-                passed += 1
-                logger.info(f"✓ {test_name} PASSED")
-            else:
+    setup_module()
+    try:
+        for test_name, test_func in tests:
+            try:
+                logger.info(f"\nRunning: {test_name}")
+                if test_func():
+                    passed += 1
+                    logger.info(f"✓ {test_name} PASSED")
+                else:
+                    failed += 1
+                    logger.error(f"✗ {test_name} FAILED")
+            except Exception as e:
                 failed += 1
-                logger.error(f"✗ {test_name} FAILED")
-        except Exception as e:
-            failed += 1
-            logger.error(f"✗ {test_name} FAILED with exception: {e}")
-            import traceback
-            traceback.print_exc()
+                logger.error(f"✗ {test_name} FAILED with exception: {e}")
+                import traceback
+                traceback.print_exc()
+    finally:
+        teardown_module()
     
     logger.info("\n" + "=" * 60)
     logger.info(f"RESULTS: {passed} passed, {failed} failed")
     logger.info("=" * 60)
     
     if failed == 0:
-        logger.info("SUCCESS: All lock cleanup tests passed!")
-        logger.info("The engine lock cleanup mechanism is working correctly.")
+        logger.info("SUCCESS: All engine lock tests passed!")
+        logger.info("The engine lock striping is working correctly.")
         return True
     else:
         logger.error(f"FAILURE: {failed} test(s) failed")
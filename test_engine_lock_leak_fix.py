@@ -9,7 +9,6 @@ import gc
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from unittest import mock
-import tracemalloc
 
 # Configure logging
 logging.basicConfig(
@@ -46,102 +45,93 @@ class MockEngine:
         self.is_available = True
 
 
+# Engine names shared by the tests, built once at import
+_LEAK_NAMES = tuple(f'leak_test_{i}' for i in range(100))
+_CONCURRENT_NAMES = tuple(f'concurrent_{i}' for i in range(50))
+
+# Registry snapshot restored after the module's tests
+_original_engines = {}
+
+
+def setup_module(module=None):
+    """Replace all engine classes with our mock once for the module"""
+    _original_engines.update(STTEngineManager.ENGINES)
+    STTEngineManager.ENGINES.update(dict.fromkeys(STTEngineManager.ENGINES, MockEngine))
+
+
+def teardown_module(module=None):
+    """Restore the engine registry, dropping engines the tests registered"""
+    STTEngineManager.ENGINES.clear()
+    STTEngineManager.ENGINES.update(_original_engines)
+    _original_engines.clear()
+
+
 def test_no_memory_leak():
     """Test that repeated engine requests don't cause memory leak"""
     
     logger.info("=" * 60)
-    logger.info("TEST: No Memory Leak with Cleanup Mechanism")
+    logger.info("TEST: No Memory Leak with Lock Striping")
     logger.info("=" * 60)
     
-    # Start memory tracking
-    tracemalloc.start()
-    
-    # Replace engines with mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockEngine
-    
-    # Add many test engines
-    for i in range(100):
-        STTEngineManager.ENGINES[f'leak_test_{i}'] = MockEngine
+    # Register all names up front so the registry is stable while engines are requested
+    names = _LEAK_NAMES
+    STTEngineManager.ENGINES.update(dict.fromkeys(names, MockEngine))
     
-    config = {'initialize_all': False}
-    for i in range(100):
-        config[f'leak_test_{i}'] = {'name': f'leak_test_{i}'}
+    config = {'initialize_all': False, **{name: {'name': name} for name in names}}
     
-    # Create manager with initialization disabled
-    config['initialize_all'] = False
     manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 1  # Fast cleanup
     # Clear any pre-initialized engines to force lazy initialization
     manager.engines.clear()
     
-    # Take initial memory snapshot
-    snapshot1 = tracemalloc.take_snapshot()
-    
-    logger.info("Phase 1: Creating 100 engine locks...")
-    
-    # Request all engines to create locks
-    for i in range(100):
-        engine = manager.get_engine(f'leak_test_{i}')
+    logger.info("Phase 1: Requesting 100 engines...")
     
-    initial_locks = len(manager._engine_locks)
-    logger.info(f"Locks created: {initial_locks}")
+    # Request all engines (each takes its stripe lock to initialize)
+    for name in names:
+        engine = manager.get_engine(name)
     
-    # Wait for TTL and trigger cleanup
-    logger.info("Phase 2: Waiting for TTL and triggering cleanup...")
-    time.sleep(manager._lock_cleanup_interval + 0.5)
-    manager._cleanup_unused_locks()
+    initial_locks = manager.get_lock_stats(include_locks=False)['total_locks']
+    logger.info(f"Locks after first pass: {initial_locks}")
     
-    locks_after_cleanup = len(manager._engine_locks)
-    logger.info(f"Locks after cleanup: {locks_after_cleanup}")
+    # Count live objects after the first pass
+    gc.collect()
+    objects_before = len(gc.get_objects())
     
-    # Take memory snapshot after cleanup
-    snapshot2 = tracemalloc.take_snapshot()
+    # Request engines again
+    logger.info("Phase 2: Re-requesting engines...")
+    for name in names:
+        engine = manager.get_engine(name)
     
-    # Request engines again (should recreate locks)
-    logger.info("Phase 3: Re-requesting engines after cleanup...")
-    for i in range(100):
-        engine = manager.get_engine(f'leak_test_{i}')
-    
-    final_locks = len(manager._engine_locks)
+    final_locks = manager.get_lock_stats(include_locks=False)['total_locks']
     logger.info(f"Final locks: {final_locks}")
     
-    # Analyze memory usage
-    top_stats = snapshot2.compare_to(snapshot1, 'lineno')
-    
-    # Check that lock count doesn't grow indefinitely
-    assert final_locks <= 100, f"Lock count grew beyond expected: {final_locks}"
-    
-    # Verify cleanup actually removed locks
-    assert locks_after_cleanup < initial_locks, "Cleanup didn't remove any locks"
+    # Re-requesting initialized engines shouldn't retain new objects
+    gc.collect()
+    object_growth = len(gc.get_objects()) - objects_before
+    logger.info(f"Object growth after second pass: {object_growth}")
     
-    logger.info("✓ No memory leak detected - cleanup is working")
+    # Lock count is fixed by the stripe count and doesn't grow with engines
+    assert initial_locks == manager._LOCK_STRIPES, f"Unexpected lock count: {initial_locks}"
+    assert final_locks == initial_locks, f"Lock count grew: {initial_locks} -> {final_locks}"
+    assert object_growth < 500, f"Object count grew by {object_growth}"
     
-    tracemalloc.stop()
+    logger.info("✓ No memory leak detected - lock count is bounded")
     return True
 
 
-def test_thread_safety_with_cleanup():
-    """Test that cleanup doesn't interfere with concurrent access"""
+def test_thread_safety_with_monitoring():
+    """Test that lock monitoring doesn't interfere with concurrent access"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("TEST: Thread Safety with Concurrent Cleanup")
+    logger.info("TEST: Thread Safety with Concurrent Monitoring")
     logger.info("=" * 60)
     
-    # Replace engines with mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockEngine
+    # Register all names up front so the registry is stable while engines are requested
+    names = _CONCURRENT_NAMES
+    STTEngineManager.ENGINES.update(dict.fromkeys(names, MockEngine))
     
-    # Add test engines
-    for i in range(50):
-        STTEngineManager.ENGINES[f'concurrent_{i}'] = MockEngine
-    
-    config = {'initialize_all': False}
-    for i in range(50):
-        config[f'concurrent_{i}'] = {'name': f'concurrent_{i}'}
+    config = {'initialize_all': False, **{name: {'name': name} for name in names}}
     
     manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 0.1  # Very aggressive cleanup
     manager.engines.clear()
     
     errors = []
@@ -149,37 +139,50 @@ def test_thread_safety_with_cleanup():
     
     def worker(worker_id):
         """Worker that constantly requests engines"""
+        name = _CONCURRENT_NAMES[worker_id % len(_CONCURRENT_NAMES)]
         try:
             for _ in range(20):
-                engine_id = worker_id % 50
-                engine = manager.get_engine(f'concurrent_{engine_id}')
-                time.sleep(0.01)
+                engine = manager.get_engine(name)
+                # Yield the GIL so workers interleave, without a timed sleep
+                time.sleep(0)
             return True
         except Exception as e:
             errors.append(str(e))
             return False
     
-    def cleanup_worker():
-        """Worker that triggers cleanup"""
-        for _ in range(10):
-            time.sleep(0.2)
-            manager._cleanup_unused_locks()
+    workers_done = threading.Event()
     
-    logger.info("Starting concurrent access with aggressive cleanup...")
+    def monitor_worker():
+        """Worker that reads lock stats until the workers finish"""
+        manager.get_lock_stats()
+        while not workers_done.is_set():
+            manager.get_lock_stats()
+            time.sleep(0)
     
-    # Start cleanup thread
-    cleanup_thread = threading.Thread(target=cleanup_worker)
-    cleanup_thread.start()
+    logger.info("Starting concurrent access with lock monitoring...")
     
-    # Start worker threads
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = [executor.submit(worker, i) for i in range(20)]
-        
-        for future in as_completed(futures):
-            if future.result():
-                success_count += 1
+    # The manager logs every engine initialization at INFO; keep only warnings
+    manager_logger = logging.getLogger('stts.engine_manager')
+    previous_level = manager_logger.level
+    manager_logger.setLevel(logging.WARNING)
     
-    cleanup_thread.join()
+    try:
+        # Start monitoring thread
+        monitor_thread = threading.Thread(target=monitor_worker)
+        monitor_thread.start()
+        
+        # Start worker threads
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [executor.submit(worker, i) for i in range(20)]
+            
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+        
+        workers_done.set()
+        monitor_thread.join()
+    finally:
+        manager_logger.setLevel(previous_level)
     
     logger.info(f"Results: {success_count}/20 successful, {len(errors)} errors")
     
@@ -187,17 +190,17 @@ def test_thread_safety_with_cleanup():
     assert success_count >= 18, f"Too many failures: {20 - success_count}"
     
     if errors:
-        logger.warning(f"Some errors occurred (expected with aggressive cleanup): {errors[:3]}")
+        logger.warning(f"Some errors occurred: {errors[:3]}")
     
-    logger.info("✓ Thread safety maintained during cleanup")
+    logger.info("✓ Thread safety maintained during monitoring")
     return True
 
 
-def test_cleanup_mechanism_attributes():
-    """Test that all cleanup mechanism attributes are present"""
+def test_lock_mechanism_attributes():
+    """Test that all lock striping attributes are present"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("TEST: Cleanup Mechanism Attributes")
+    logger.info("TEST: Lock Mechanism Attributes")
     logger.info("=" * 60)
     
     # Create manager
@@ -205,11 +208,9 @@ def test_cleanup_mechanism_attributes():
     
     # Check required attributes
     required_attrs = [
-        '_cleanup_unused_locks',  # Cleanup method
-        '_get_or_create_lock',     # Lock creation with tracking
-        '_lock_refs',              # Weak references
-        '_lock_last_used',         # TTL tracking
-        '_lock_cleanup_interval',  # Cleanup interval
+        '_get_or_create_lock',     # Lock lookup by engine name
+        '_engine_lock_stripes',    # Fixed pool of locks
+        '_LOCK_STRIPES',           # Stripe count
         'get_lock_stats'           # Monitoring method
     ]
     
@@ -217,10 +218,10 @@ def test_cleanup_mechanism_attributes():
         assert hasattr(manager, attr), f"Missing required attribute: {attr}"
         logger.info(f"✓ {attr} present")
     
-    # Verify cleanup interval is reasonable
-    assert manager._lock_cleanup_interval > 0, "Cleanup interval must be positive"
-    assert manager._lock_cleanup_interval <= 3600, "Cleanup interval too long"
-    logger.info(f"✓ Cleanup interval: {manager._lock_cleanup_interval} seconds")
+    # Verify stripe count is reasonable
+    assert manager._LOCK_STRIPES > 0, "Stripe count must be positive"
+    assert len(manager._engine_lock_stripes) == manager._LOCK_STRIPES, "Stripe pool size mismatch"
+    logger.info(f"✓ Lock stripes: {manager._LOCK_STRIPES}")
     
     # Test get_lock_stats works
     stats = manager.get_lock_stats()
@@ -228,63 +229,50 @@ def test_cleanup_mechanism_attributes():
     assert 'locks' in stats, "Stats missing locks dict"
     logger.info(f"✓ Lock stats working: {stats}")
     
-    logger.info("✓ All cleanup mechanism attributes present and functional")
+    logger.info("✓ All lock mechanism attributes present and functional")
     return True
 
 
-def test_lock_recreation():
-    """Test that locks can be recreated after cleanup"""
+def test_lock_stripes_bounded():
+    """Test that locks stay bounded and stable across many engine names"""
     
     logger.info("\n" + "=" * 60)
-    logger.info("TEST: Lock Recreation After Cleanup")
+    logger.info("TEST: Bounded Lock Stripes")
     logger.info("=" * 60)
     
-    # Replace engines with mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockEngine
-    
-    STTEngineManager.ENGINES['recreate_test'] = MockEngine
+    STTEngineManager.ENGINES['stripe_test'] = MockEngine
     
     config = {
         'initialize_all': False,
-        'recreate_test': {'name': 'recreate_test'}
+        'stripe_test': {'name': 'stripe_test'}
     }
     
     manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 0.5
     manager.engines.clear()
     
     # First access
-    logger.info("1. First access - creating lock")
-    engine1 = manager.get_engine('recreate_test')
-    assert 'recreate_test' in manager._engine_locks
-    lock1_id = id(manager._engine_locks['recreate_test'])
-    logger.info(f"   Lock created with ID: {lock1_id}")
-    
-    # Wait and cleanup
-    logger.info("2. Waiting for TTL and cleaning up")
-    time.sleep(manager._lock_cleanup_interval + 0.1)
-    manager._cleanup_unused_locks()
-    assert 'recreate_test' not in manager._engine_locks
-    logger.info("   Lock successfully cleaned up")
-    
-    # Second access - should recreate
-    logger.info("3. Second access - recreating lock")
-    engine2 = manager.get_engine('recreate_test')
-    assert 'recreate_test' in manager._engine_locks
-    lock2_id = id(manager._engine_locks['recreate_test'])
-    logger.info(f"   Lock recreated with ID: {lock2_id}")
-    
-    # Verify it's a new lock object
-    assert lock1_id != lock2_id, "Should be a new lock object"
-    logger.info("   ✓ New lock object created")
+    logger.info("1. First access")
+    engine1 = manager.get_engine('stripe_test')
+    lock1 = manager._get_or_create_lock('stripe_test')
+    
+    # Many distinct names share the fixed pool of locks
+    logger.info("2. Looking up locks for 1000 distinct names")
+    distinct_locks = {id(manager._get_or_create_lock(f'bounded_{i}')) for i in range(1000)}
+    logger.info(f"   Distinct locks: {len(distinct_locks)}")
+    assert len(distinct_locks) <= manager._LOCK_STRIPES, "Lock count not bounded by stripes"
+    
+    # The same name always maps to the same lock
+    logger.info("3. Second access")
+    engine2 = manager.get_engine('stripe_test')
+    assert manager._get_or_create_lock('stripe_test') is lock1, "Lock for stripe_test changed"
+    logger.info("   ✓ Same lock returned")
     
     # Verify engine still works
-    assert engine2 is not None
-    assert engine2.name == 'recreate_test'
+    assert engine2 is engine1
+    assert engine2.name == 'stripe_test'
     logger.info("   ✓ Engine still functional")
     
-    logger.info("✓ Locks can be recreated after cleanup")
+    logger.info("✓ Lock stripes are bounded and stable")
     return True
 
 
@@ -292,10 +280,10 @@ def run_all_tests():
     """Run all comprehensive tests"""
     
     tests = [
-        ("Cleanup Mechanism Attributes", test_cleanup_mechanism_attributes),
+        ("Lock Mechanism Attributes", test_lock_mechanism_attributes),
         ("No Memory Leak", test_no_memory_leak),
-        ("Thread Safety with Cleanup", test_thread_safety_with_cleanup),
-        ("Lock Recreation", test_lock_recreation)
+        ("Thread Safety with Monitoring", test_thread_safety_with_monitoring),
+        ("Bounded Lock Stripes", test_lock_stripes_bounded)
     ]
     
     passed = 0
@@ -305,19 +293,24 @@ def run_all_tests():
     logger.info("ENGINE LOCK LEAK FIX - COMPREHENSIVE TEST SUITE")
     logger.info("=" * 60)
     
-    for test_name, test_func in tests:
-        try:
-            logger.info(f"\nRunning: {test_name}")
-            if test_func():
-                passed += 1
-                logger.info(f"✓✓✓ {test_name} PASSED")
-            else:
+    setup_module()
+    try:
+        for test_name, test_func in tests:
+            try:
+                logger.info(f"\nRunning: {test_name}")
+                if test_func():
+                    passed += 1
+                    logger.info(f"✓✓✓ {test_name} PASSED")
+                else:
+                    failed += 1
+                    logger.error(f"✗✗✗ {test_name} FAILED")
+            except Exception as e:
                 failed += 1
-                logger.error(f"✗✗✗ {test_name} FAILED")
-        except Exception as e:
-            failed += 1
-            logger.error(f"✗✗✗ {test_name} FAILED with exception: {e}")
-            traceback.print_exc()
+                logger.error(f"✗✗✗ {test_name} FAILED with exception: {e}")
+                import traceback
+                traceback.print_exc()
+    finally:
+        teardown_module()
     
     logger.info("\n" + "=" * 60)
     logger.info(f"FINAL RESULTS: {passed} passed, {failed} failed")
@@ -327,11 +320,10 @@ def run_all_tests():
         logger.info("\n🎉 SUCCESS: All tests passed!")
         logger.info("The engine lock leak has been successfully fixed.")
         logger.info("\nKey improvements:")
-        logger.info("1. TTL-based cleanup removes unused locks after 5 minutes")
-        logger.info("2. Weak references track lock lifecycle")
-        logger.info("3. Thread-safe cleanup doesn't interfere with active locks")
+        logger.info("1. Fixed pool of lock stripes bounds memory for any number of engine names")
+        logger.info("2. The same engine name always maps to the same lock")
+        logger.info("3. No cleanup pass is needed, so nothing can remove an active lock")
         logger.info("4. Monitoring via get_lock_stats() for production visibility")
-        logger.info("5. Locks can be recreated as needed after cleanup")
         return True
     else:
         logger.error(f"\n❌ FAILURE: {failed} test(s) failed")
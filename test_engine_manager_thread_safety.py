@@ -6,12 +6,14 @@ import os
 import threading
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from unittest import mock
 
-# Configure logging
+# Configure logging; progress output is opt-in (STTS_VERBOSE_TESTS=1), otherwise
+# only warnings and failures are reported
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.INFO if os.environ.get('STTS_VERBOSE_TESTS') == '1' else logging.WARNING,
     format='%(asctime)s - %(threadName)-10s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -27,30 +29,32 @@ mock_modules = [
     'pocketsphinx', 'vosk', 'STT', 'stt', 'whisper'
 ]
 
-for module_name in mock_modules:
-    sys.modules[module_name] = mock.MagicMock()
+# The engines are replaced by mocks, so the stubs only need to import;
+# one shared MagicMock serves every module
+_module_stub = mock.MagicMock()
+sys.modules.update(dict.fromkeys(mock_modules, _module_stub))
 
 # Now import our module
 from stts.engine_manager import STTEngineManager
 
+# threading.Lock is a factory function, so take the lock type from an instance once
+_LockType = type(threading.Lock())
+
 
 class MockSTTEngine:
     """Mock STT Engine that simulates initialization delay"""
     
-    initialization_count = {}
-    initialization_lock = threading.Lock()
+    # One entry per construction; list.append is atomic, so no lock is needed
+    initialization_attempts = []
     
     def __init__(self, config):
         # Track initialization attempts
         engine_name = config.get('name', 'unknown')
-        with self.initialization_lock:
-            if engine_name not in self.initialization_count:
-                self.initialization_count[engine_name] = 0
-            self.initialization_count[engine_name] += 1
-            count = self.initialization_count[engine_name]
+        self.initialization_attempts.append(engine_name)
+        count = self.initialization_attempts.count(engine_name)
         
-        # Simulate initialization delay
-        time.sleep(0.05)
+        # Simulate a short initialization delay while holding the engine's lock
+        time.sleep(0.001)
         
         self.config = config
         self.name = engine_name
@@ -60,6 +64,11 @@ class MockSTTEngine:
         
         if count > 1:
             logger.warning(f"WARNING: Duplicate initialization of {engine_name}!")
+    
+    @classmethod
+    def get_count(cls, engine_name):
+        """Number of times the named engine was constructed"""
+        return cls.initialization_attempts.count(engine_name)
 
 
 def test_thread_safe_initialization():
@@ -69,144 +78,135 @@ def test_thread_safe_initialization():
     logger.info("Testing Thread-Safe Engine Manager")
     logger.info("=" * 60)
     
-    # Replace all engine classes with our mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockSTTEngine
-    
-    # Reset initialization counter
-    MockSTTEngine.initialization_count = {}
-    
-    # Create manager with no pre-initialization
-    config = {
-        'initialize_all': False,
-        'whisper': {'name': 'whisper'},
-        'vosk': {'name': 'vosk'},
-        'silero': {'name': 'silero'}
-    }
-    
-    manager = STTEngineManager(default_engine='whisper', config=config)
-    
-    # Verify thread safety attributes exist
-    assert hasattr(manager, '_engine_locks'), "Missing _engine_locks attribute"
-    assert hasattr(manager, '_locks_lock'), "Missing _locks_lock attribute"
-    assert isinstance(manager._locks_lock, type(threading.Lock())), "_locks_lock should be a Lock"
+    # Replace all engine classes with our mock, restoring the registry afterwards
+    original_engines = dict(STTEngineManager.ENGINES)
+    STTEngineManager.ENGINES.update(dict.fromkeys(original_engines, MockSTTEngine))
     
-    logger.info("✓ Thread safety attributes properly initialized")
-    
-    # Test concurrent access to the same engine
-    logger.info("\nTest 1: Concurrent access to same engine")
-    logger.info("-" * 40)
-    
-    results = []
-    errors = []
-    
-    def get_engine_worker(engine_name, worker_id):
-        thread_name = f"Worker-{worker_id:02d}"
-        threading.current_thread().name = thread_name
-        
-        try:
-            logger.debug(f"{thread_name} requesting {engine_name}")
-            engine = manager.get_engine(engine_name)
-            logger.debug(f"{thread_name} got {engine_name}")
-            return f"Success: {thread_name}"
-        except Exception as e:
-            logger.error(f"{thread_name} failed: {e}")
-            return f"Error: {thread_name} - {e}"
-    
-    # Launch 20 threads all trying to get 'whisper' engine
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = [
-            executor.submit(get_engine_worker, 'whisper', i)
-            for i in range(20)
-        ]
-        
-        for future in as_completed(futures):
-            result = future.result()
-            if result.startswith("Success"):
-                results.append(result)
+    try:
+        # Reset initialization counter
+        MockSTTEngine.initialization_attempts = []
+        
+        # Create manager with no pre-initialization
+        config = {
+            'initialize_all': False,
+            'whisper': {'name': 'whisper'},
+            'vosk': {'name': 'vosk'},
+            'silero': {'name': 'silero'}
+        }
+        
+        manager = STTEngineManager(default_engine='whisper', config=config)
+        
+        # Configured engines are initialized at startup; clear them so the
+        # concurrent requests below race on lazy initialization
+        manager.engines.clear()
+        MockSTTEngine.initialization_attempts = []
+        
+        # Verify thread safety attributes exist
+        assert hasattr(manager, '_engine_lock_stripes'), "Missing _engine_lock_stripes attribute"
+        assert len(manager._engine_lock_stripes) == manager._LOCK_STRIPES, "Unexpected stripe count"
+        
+        logger.info("✓ Thread safety attributes properly initialized")
+        
+        # Test concurrent access to the same engine
+        logger.info("\nTest 1: Concurrent access to same engine")
+        logger.info("-" * 40)
+        
+        results = []
+        errors = []
+        # Releases every worker of a wave into get_engine at the same moment
+        start_barrier = threading.Barrier(20)
+        
+        def get_engine_worker(engine_name, worker_id):
+            worker_name = f"Worker-{worker_id:02d}"
+            
+            try:
+                start_barrier.wait(timeout=2)
+                logger.debug(f"{worker_name} requesting {engine_name}")
+                engine = manager.get_engine(engine_name)
+                logger.debug(f"{worker_name} got {engine_name}")
+                return f"Success: {worker_name}"
+            except Exception as e:
+                logger.error(f"{worker_name} failed: {e}")
+                return f"Error: {worker_name} - {e}"
+        
+        # One pool serves both waves; Test 2 reuses the threads started in Test 1
+        test2_work = [(engine, i + 100) for engine in ('whisper', 'vosk', 'silero') for i in range(10)]
+        
+        with ThreadPoolExecutor(max_workers=len(test2_work)) as executor:
+            # Launch 20 threads all trying to get 'whisper' engine
+            for result in executor.map(get_engine_worker, repeat('whisper', 20), range(20)):
+                if result.startswith("Success"):
+                    results.append(result)
+                else:
+                    errors.append(result)
+            
+            # Check initialization count
+            whisper_count = MockSTTEngine.get_count('whisper')
+            logger.info(f"\nWhisper initialization count: {whisper_count}")
+            
+            if whisper_count == 1:
+                logger.info("✓ PASS: Whisper initialized exactly once")
             else:
-                errors.append(result)
-    
-    # Check initialization count
-    whisper_count = MockSTTEngine.initialization_count.get('whisper', 0)
-    logger.info(f"\nWhisper initialization count: {whisper_count}")
-    
-    if whisper_count == 1:
-        logger.info("✓ PASS: Whisper initialized exactly once")
-    else:
-        logger.error(f"✗ FAIL: Whisper initialized {whisper_count} times (expected 1)")
-        return False
-    
-    # Test 2: Multiple engines with concurrent requests
-    logger.info("\nTest 2: Multiple engines with concurrent requests")
-    logger.info("-" * 40)
-    
-    with ThreadPoolExecutor(max_workers=30) as executor:
-        futures = []
-        # 10 threads each for whisper (already initialized), vosk, and silero
+                logger.error(f"✗ FAIL: Whisper initialized {whisper_count} times (expected 1)")
+                return False
+            
+            # Test 2: Multiple engines with concurrent requests
+            logger.info("\nTest 2: Multiple engines with concurrent requests")
+            logger.info("-" * 40)
+            
+            start_barrier = threading.Barrier(len(test2_work))
+            
+            # 10 threads each for whisper (already initialized), vosk, and silero
+            list(executor.map(get_engine_worker, *zip(*test2_work)))
+        
+        # Check initialization counts
+        logger.info("\nFinal initialization counts:")
+        all_correct = True
         for engine in ['whisper', 'vosk', 'silero']:
-            for i in range(10):
-                futures.append(
-                    executor.submit(get_engine_worker, engine, i + 100)
-                )
+            count = MockSTTEngine.get_count(engine)
+            expected = 1
+            status = "✓" if count == expected else "✗"
+            logger.info(f"  {engine}: {count} {status}")
+            if count != expected:
+                all_correct = False
         
-        for future in as_completed(futures):
-            result = future.result()
-    
-    # Check initialization counts
-    logger.info("\nFinal initialization counts:")
-    all_correct = True
-    for engine in ['whisper', 'vosk', 'silero']:
-        count = MockSTTEngine.initialization_count.get(engine, 0)
-        expected = 1
-        status = "✓" if count == expected else "✗"
-        logger.info(f"  {engine}: {count} {status}")
-        if count != expected:
-            all_correct = False
-    
-    if not all_correct:
-        logger.error("\n✗ FAIL: Some engines were initialized multiple times")
-        return False
-    
-    logger.info("\n✓ PASS: All engines initialized exactly once")
-    
-    # Test 3: Check that locks are created per engine
-    logger.info("\nTest 3: Verify per-engine locks")
-    logger.info("-" * 40)
-    
-    # After initialization, we should have locks for each accessed engine
-    if 'whisper' in manager._engine_locks:
-        logger.info("✓ Lock created for 'whisper'")
-    else:
-        logger.error("✗ No lock for 'whisper'")
-        return False
-    
-    if 'vosk' in manager._engine_locks:
-        logger.info("✓ Lock created for 'vosk'")
-    else:
-        logger.error("✗ No lock for 'vosk'")
-        return False
-    
-    if 'silero' in manager._engine_locks:
-        logger.info("✓ Lock created for 'silero'")
-    else:
-        logger.error("✗ No lock for 'silero'")
-        return False
-    
-    # Verify all locks are actual Lock objects
-    for engine_name, lock in manager._engine_locks.items():
-        if not isinstance(lock, type(threading.Lock())):
-            logger.error(f"✗ {engine_name} lock is not a threading.Lock")
+        if not all_correct:
+            logger.error("\n✗ FAIL: Some engines were initialized multiple times")
             return False
+        
+        logger.info("\n✓ PASS: All engines initialized exactly once")
+        
+        # Test 3: Check that each engine maps to a lock stripe
+        logger.info("\nTest 3: Verify per-engine lock stripes")
+        logger.info("-" * 40)
+        
+        # Each accessed engine should map to a stable lock stripe
+        for engine_name in ['whisper', 'vosk', 'silero']:
+            lock = manager._get_or_create_lock(engine_name)
+            if lock in manager._engine_lock_stripes and manager._get_or_create_lock(engine_name) is lock:
+                logger.info(f"✓ Lock stripe for '{engine_name}'")
+            else:
+                logger.error(f"✗ No stable lock stripe for '{engine_name}'")
+                return False
+        
+        # Verify all locks are actual Lock objects
+        for lock in manager._engine_lock_stripes:
+            if not isinstance(lock, _LockType):
+                logger.error("✗ Lock stripe is not a threading.Lock")
+                return False
+        
+        logger.info("✓ All engine locks are proper threading.Lock objects")
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("SUCCESS: All thread safety tests PASSED!")
+        logger.info("The engine manager is properly thread-safe.")
+        logger.info("=" * 60)
+        
+        return True
     
-    logger.info("✓ All engine locks are proper threading.Lock objects")
-    
-    logger.info("\n" + "=" * 60)
-    logger.info("SUCCESS: All thread safety tests PASSED!")
-    logger.info("The engine manager is properly thread-safe.")
-    logger.info("=" * 60)
-    
-    return True
+    finally:
+        STTEngineManager.ENGINES.clear()
+        STTEngineManager.ENGINES.update(original_engines)
 
 
 if __name__ == "__main__":
@@ -34,108 +34,76 @@ class TestEngine(BaseSTTEngine):
         return True
 
 
-class TestBaseEngineExceptionHandling(unittest.TestCase):
-    """Test exception handling in BaseSTTEngine"""
+def _log_has(capture, needle, levelname=None):
+    """Check whether any captured log record's message contains needle
     
-    def setUp(self):
-        # Configure logging to capture messages
-        self.log_capture = []
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_capture.append(record)
-        logging.getLogger('stts.base_engine').addHandler(self.handler)
-        logging.getLogger('stts.base_engine').setLevel(logging.DEBUG)
+    Args:
+        capture: Captured log records
+        needle: Substring to look for in each record's message
+        levelname: Only consider records at this level (e.g. "WARNING")
+        
+    Returns:
+        True if a matching record was captured
+    """
+    return any(needle in record.getMessage() for record in capture
+               if levelname is None or record.levelname == levelname)
+
+
+class _LogCaptureTestCase(unittest.TestCase):
+    """TestCase capturing the records of one logger, with one handler per class"""
     
-    def tearDown(self):
-        logging.getLogger('stts.base_engine').removeHandler(self.handler)
+    # Name of the logger whose records are captured
+    logger_name = None
     
-    def test_is_available_import_error(self):
-        """Test handling of ImportError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=ImportError("test module not found"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        # Check that debug log was written
-        self.assertTrue(any("dependency not available" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    @classmethod
+    def setUpClass(cls):
+        # Configure logging to capture messages with one handler for the class
+        cls.log_capture = []
+        cls.handler = logging.Handler()
+        cls.handler.emit = cls.log_capture.append
+        logging.getLogger(cls.logger_name).addHandler(cls.handler)
+        logging.getLogger(cls.logger_name).setLevel(logging.DEBUG)
     
-    def test_is_available_module_not_found_error(self):
-        """Test handling of ModuleNotFoundError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=ModuleNotFoundError("whisper"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("dependency not available" in str(record.getMessage()) 
-                           for record in self.log_capture))
-    
-    def test_is_available_file_not_found_error(self):
-        """Test handling of FileNotFoundError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=FileNotFoundError("model.pb"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("model file error" in str(record.getMessage()) 
-                           for record in self.log_capture))
-    
-    def test_is_available_os_error(self):
-        """Test handling of OSError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=OSError("Permission denied"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("model file error" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    @classmethod
+    def tearDownClass(cls):
+        logging.getLogger(cls.logger_name).removeHandler(cls.handler)
     
-    def test_is_available_attribute_error(self):
-        """Test handling of AttributeError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=AttributeError("'NoneType' object has no attribute 'model'"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("configuration error" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    def setUp(self):
+        # Start each test with an empty capture
+        self.log_capture.clear()
+
+
+class TestBaseEngineExceptionHandling(_LogCaptureTestCase):
+    """Test exception handling in BaseSTTEngine"""
     
-    def test_is_available_type_error(self):
-        """Test handling of TypeError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=TypeError("Expected str, got int"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("configuration error" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    logger_name = 'stts.base_engine'
     
-    def test_is_available_value_error(self):
-        """Test handling of ValueError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=ValueError("Invalid model size"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("configuration error" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    # Exceptions raised by _check_availability and the message each should log
+    CASES = [
+        (ImportError("test module not found"), "dependency not available"),
+        (ModuleNotFoundError("whisper"), "dependency not available"),
+        (FileNotFoundError("model.pb"), "model file error"),
+        (OSError("Permission denied"), "model file error"),
+        (AttributeError("'NoneType' object has no attribute 'model'"), "configuration error"),
+        (TypeError("Expected str, got int"), "configuration error"),
+        (ValueError("Invalid model size"), "configuration error"),
+        (RuntimeError("CUDA out of memory"), "runtime error"),
+    ]
     
-    def test_is_available_runtime_error(self):
-        """Test handling of RuntimeError in is_available property"""
-        engine = TestEngine()
-        engine._check_availability = Mock(side_effect=RuntimeError("CUDA out of memory"))
-        
-        result = engine.is_available
-        
-        self.assertFalse(result)
-        self.assertTrue(any("runtime error" in str(record.getMessage()) 
-                           for record in self.log_capture))
+    def test_is_available_exceptions(self):
+        """Test handling of each expected exception category in is_available property"""
+        for exception, needle in self.CASES:
+            with self.subTest(exc=type(exception).__name__):
+                # Only look at the records logged by this case
+                first_record = len(self.log_capture)
+                
+                engine = TestEngine()
+                engine._check_availability = Mock(side_effect=exception)
+                
+                result = engine.is_available
+                
+                self.assertFalse(result)
+                self.assertTrue(_log_has(self.log_capture[first_record:], needle))
     
     def test_is_available_unexpected_exception(self):
         """Test handling of unexpected exceptions in is_available property"""
@@ -149,10 +117,8 @@ class TestBaseEngineExceptionHandling(unittest.TestCase):
         
         self.assertFalse(result)
         # Should log as warning for unexpected exceptions
-        self.assertTrue(any(record.levelname == "WARNING" and "unexpected error" in str(record.getMessage()).lower()
-                           for record in self.log_capture))
-        self.assertTrue(any("CustomException" in str(record.getMessage())
-                           for record in self.log_capture))
+        self.assertTrue(_log_has(self.log_capture, "unexpected error", levelname="WARNING"))
+        self.assertTrue(_log_has(self.log_capture, "CustomException"))
     
     def test_is_available_success(self):
         """Test successful availability check"""
@@ -167,19 +133,10 @@ class TestBaseEngineExceptionHandling(unittest.TestCase):
                             for record in self.log_capture))
 
 
-class TestSpeechToTextEngineExceptionHandling(unittest.TestCase):
+class TestSpeechToTextEngineExceptionHandling(_LogCaptureTestCase):
     """Test exception handling in SpeechToTextEngine"""
     
-    def setUp(self):
-        # Configure logging to capture messages
-        self.log_capture = []
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_capture.append(record)
-        logging.getLogger('stts.engine').addHandler(self.handler)
-        logging.getLogger('stts.engine').setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        logging.getLogger('stts.engine').removeHandler(self.handler)
+    logger_name = 'stts.engine'
     
     @patch('stts.engine.STTEngineManager')
     def test_setup_legacy_support_value_error(self, mock_manager_class):
@@ -194,8 +151,7 @@ class TestSpeechToTextEngineExceptionHandling(unittest.TestCase):
         # Should not have model attribute
         self.assertFalse(hasattr(engine, 'model'))
         # Check that debug log was written
-        self.assertTrue(any("Could not setup legacy model attribute" in str(record.getMessage()) 
-                           for record in self.log_capture))
+        self.assertTrue(_log_has(self.log_capture, "Could not setup legacy model attribute"))
     
     @patch('stts.engine.STTEngineManager')
     def test_setup_legacy_support_attribute_error(self, mock_manager_class):
@@ -211,8 +167,7 @@ class TestSpeechToTextEngineExceptionHandling(unittest.TestCase):
         # Should not have model attribute
         self.assertFalse(hasattr(engine, 'model'))
         # Check that debug log was written
-        self.assertTrue(any("doesn't have model attribute" in str(record.getMessage()) 
-                           for record in self.log_capture))
+        self.assertTrue(_log_has(self.log_capture, "doesn't have model attribute"))
     
     @patch('stts.engine.STTEngineManager')
     def test_setup_legacy_support_unexpected_exception(self, mock_manager_class):
@@ -230,10 +185,8 @@ class TestSpeechToTextEngineExceptionHandling(unittest.TestCase):
         # Should not have model attribute
         self.assertFalse(hasattr(engine, 'model'))
         # Check that debug log was written
-        self.assertTrue(any("Unexpected error during legacy support setup" in str(record.getMessage()) 
-                           for record in self.log_capture))
-        self.assertTrue(any("CustomException" in str(record.getMessage())
-                           for record in self.log_capture))
+        self.assertTrue(_log_has(self.log_capture, "Unexpected error during legacy support setup"))
+        self.assertTrue(_log_has(self.log_capture, "CustomException"))
     
     @patch('stts.engine.STTEngineManager')
     def test_setup_legacy_support_success(self, mock_manager_class):
@@ -12,6 +12,84 @@ import types
 
 # Create a minimal test that only tests the exception handling logic
 
+# Exception classes grouped as in the except clauses of base_engine.py's is_available
+_DEPENDENCY_ERRORS = (ImportError, ModuleNotFoundError)
+_MODEL_FILE_ERRORS = (FileNotFoundError, OSError)
+_CONFIGURATION_ERRORS = (AttributeError, TypeError, ValueError)
+_RUNTIME_ERRORS = (RuntimeError,)
+
+# Lookup tables built once at import: (exception classes, value) pairs in
+# except-clause order, so the first isinstance match wins as it would in the
+# real handlers
+_CATEGORY_BY_TYPE = (
+    (_DEPENDENCY_ERRORS, "dependency not available"),
+    (_MODEL_FILE_ERRORS, "model file error"),
+    (_CONFIGURATION_ERRORS, "configuration error"),
+    (_RUNTIME_ERRORS, "runtime error"),
+)
+
+_MESSAGE_FMT_BY_TYPE = tuple(
+    (exc_types, lambda name, e, category=category: f"Engine {name} {category}: {e}")
+    for exc_types, category in _CATEGORY_BY_TYPE
+)
+
+_LOG_LEVEL_BY_TYPE = tuple((exc_types, logging.DEBUG) for exc_types, _ in _CATEGORY_BY_TYPE)
+
+# Messages logged by the except clauses of engine.py's _setup_legacy_support
+_LEGACY_MESSAGE_FMT_BY_TYPE = (
+    (ValueError, lambda e: f"Could not setup legacy model attribute: {e}"),
+    (AttributeError, lambda e: f"Engine doesn't have model attribute for legacy support: {e}"),
+)
+
+
+class _ValueImportError(ValueError, ImportError):
+    """Matches two is_available clauses; the earlier ImportError clause wins"""
+
+
+class _AttributeValueError(AttributeError, ValueError):
+    """Matches two _setup_legacy_support clauses; the earlier ValueError clause wins"""
+
+
+# One exception per except clause of is_available, in clause order
+_IS_AVAILABLE_CLAUSE_EXCEPTIONS = (
+    ImportError("module not found"),
+    FileNotFoundError("model.pb"),
+    ValueError("invalid value"),
+    RuntimeError("CUDA error"),
+    Exception("generic"),
+    # Subclasses of listed classes, caught through their base's clause
+    PermissionError("Permission denied"),
+    ConnectionError("connection reset"),
+    # Multiple inheritance, caught by the first matching clause
+    _ValueImportError("ambiguous"),
+)
+
+# One exception per except clause of _setup_legacy_support, in clause order
+_LEGACY_CLAUSE_EXCEPTIONS = (
+    ValueError("Unknown engine"),
+    AttributeError("no model"),
+    Exception("generic"),
+    # Multiple inheritance, caught by the first matching clause
+    _AttributeValueError("ambiguous"),
+)
+
+
+def _lookup_by_type(table, exception, default=None):
+    """Look up an exception in a clause-ordered table
+    
+    Returns the value of the first entry whose classes the exception is an
+    instance of, matching which except clause would catch it.
+    
+    Args:
+        table: Tuple of (exception class or classes, value) pairs in clause order
+        exception: Exception instance to look up
+        default: Value returned when no entry matches
+        
+    Returns:
+        The value of the first matching entry, or default
+    """
+    return next((value for exc_types, value in table if isinstance(exception, exc_types)), default)
+
 
 class TestExceptionHandlingLogic(unittest.TestCase):
     """Test the exception handling logic in isolation"""
@@ -58,34 +136,54 @@ class TestExceptionHandlingLogic(unittest.TestCase):
                 self.assertFalse(isinstance(exception, Exception))
                 self.assertTrue(isinstance(exception, BaseException))
     
+    def test_handlers_catch_raised_exceptions(self):
+        """Test that the table-driven helpers agree with really raising through the except clauses"""
+        for exception in _IS_AVAILABLE_CLAUSE_EXCEPTIONS:
+            with self.subTest(exception=exception):
+                available, category = self._raise_through_is_available_handlers(exception)
+                self.assertFalse(available)
+                self.assertEqual(self._simulate_is_available_logic(exception), available)
+                self.assertEqual(self._categorize_exception(exception), category)
+        
+        for exception in _LEGACY_CLAUSE_EXCEPTIONS:
+            with self.subTest(legacy_exception=exception):
+                self.assertEqual(self._simulate_legacy_support_logic(exception),
+                                 self._raise_through_legacy_support_handlers(exception))
+    
     def _simulate_is_available_logic(self, exception):
-        """Simulate the is_available property logic"""
+        """Simulate the is_available property logic without raising
+        
+        A shortcut for the parameterized tests; test_handlers_catch_raised_exceptions
+        checks it against _raise_through_is_available_handlers, the reference.
+        """
+        return not isinstance(exception, Exception)
+    
+    def _raise_through_is_available_handlers(self, exception):
+        """Raise the exception through the is_available except clauses
+        
+        This is the reference the table-driven helpers are checked against: the
+        real except clauses, in base_engine.py's order.
+        
+        Returns:
+            Tuple of (availability, category of the clause that caught it)
+        """
         try:
             raise exception
         except (ImportError, ModuleNotFoundError):
-            return False
+            return False, "dependency not available"
         except (FileNotFoundError, OSError):
-            return False
+            return False, "model file error"
         except (AttributeError, TypeError, ValueError):
-            return False
+            return False, "configuration error"
         except RuntimeError:
-            return False
+            return False, "runtime error"
         except Exception:
-            return False
-        return True
+            return False, "unexpected error"
+        return True, None
     
     def _categorize_exception(self, exception):
         """Categorize exception based on the handling logic"""
-        if isinstance(exception, (ImportError, ModuleNotFoundError)):
-            return "dependency not available"
-        elif isinstance(exception, (FileNotFoundError, OSError)):
-            return "model file error"
-        elif isinstance(exception, (AttributeError, TypeError, ValueError)):
-            return "configuration error"
-        elif isinstance(exception, RuntimeError):
-            return "runtime error"
-        else:
-            return "unexpected error"
+        return _lookup_by_type(_CATEGORY_BY_TYPE, exception, "unexpected error")
     
     def test_legacy_support_exception_handling(self):
         """Test the exception handling in _setup_legacy_support"""
@@ -105,6 +203,13 @@ class TestExceptionHandlingLogic(unittest.TestCase):
     
     def _simulate_legacy_support_logic(self, exception):
         """Simulate the _setup_legacy_support exception logic"""
+        format_message = _lookup_by_type(_LEGACY_MESSAGE_FMT_BY_TYPE, exception)
+        if format_message is not None:
+            return format_message(exception)
+        return f"Unexpected error during legacy support setup: {type(exception).__name__}: {exception}"
+    
+    def _raise_through_legacy_support_handlers(self, exception):
+        """Raise the exception through the _setup_legacy_support except clauses"""
         try:
             raise exception
         except ValueError as e:
@@ -151,16 +256,10 @@ class TestExceptionMessages(unittest.TestCase):
     
     def _format_exception_message(self, engine_name, exception):
         """Format exception message as done in base_engine.py"""
-        if isinstance(exception, (ImportError, ModuleNotFoundError)):
-            return f"Engine {engine_name} dependency not available: {exception}"
-        elif isinstance(exception, (FileNotFoundError, OSError)):
-            return f"Engine {engine_name} model file error: {exception}"
-        elif isinstance(exception, (AttributeError, TypeError, ValueError)):
-            return f"Engine {engine_name} configuration error: {exception}"
-        elif isinstance(exception, RuntimeError):
-            return f"Engine {engine_name} runtime error: {exception}"
-        else:
-            return f"Engine {engine_name} unexpected error during availability check: {type(exception).__name__}: {exception}"
+        format_message = _lookup_by_type(_MESSAGE_FMT_BY_TYPE, exception)
+        if format_message is not None:
+            return format_message(engine_name, exception)
+        return f"Engine {engine_name} unexpected error during availability check: {type(exception).__name__}: {exception}"
 
 
 class TestLoggingLevels(unittest.TestCase):
@@ -201,11 +300,7 @@ class TestLoggingLevels(unittest.TestCase):
     def _get_log_level_for_exception(self, exception, is_availability_check=False):
         """Determine appropriate log level based on exception type"""
         if is_availability_check:
-            if isinstance(exception, (ImportError, ModuleNotFoundError, FileNotFoundError, 
-                                     OSError, AttributeError, TypeError, ValueError, RuntimeError)):
-                return logging.DEBUG
-            else:
-                return logging.WARNING
+            return _lookup_by_type(_LOG_LEVEL_BY_TYPE, exception, logging.WARNING)
         else:
             return logging.ERROR
 
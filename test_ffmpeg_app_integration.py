@@ -53,13 +53,13 @@ def test_ffmpeg_cleanup_monitoring():
         
         engine = TestSTTEngine()
         
-        # Create test WAV data
+        # Create test WAV data (8kHz, so normalization has to run FFmpeg)
         wav_header = b'RIFF' + b'\x24\x08\x00\x00' + b'WAVE'
         wav_header += b'fmt ' + b'\x10\x00\x00\x00'
         wav_header += b'\x01\x00'  # PCM
         wav_header += b'\x01\x00'  # 1 channel
-        wav_header += b'\x80\x3e\x00\x00'  # 16000 Hz
-        wav_header += b'\x00\x7d\x00\x00'  # byte rate
+        wav_header += b'\x40\x1f\x00\x00'  # 8000 Hz
+        wav_header += b'\x80\x3e\x00\x00'  # byte rate
         wav_header += b'\x02\x00'  # block align
         wav_header += b'\x10\x00'  # 16 bits
         wav_header += b'data' + b'\x00\x08\x00\x00'
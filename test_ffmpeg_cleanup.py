@@ -12,6 +12,7 @@ import os
 import signal
 import psutil
 import tempfile
+import struct
 from unittest.mock import patch, MagicMock
 from io import BytesIO
 
@@ -19,7 +20,7 @@ from io import BytesIO
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from stts.base_engine import FFmpegProcessManager, ProcessTimeoutError
+from stts.base_engine import FFmpegProcessManager, ProcessTimeoutError, _is_canonical_wav
 
 
 class TestFFmpegProcessCleanup(unittest.TestCase):
@@ -314,6 +315,74 @@ class TestFFmpegProcessCleanup(unittest.TestCase):
                         f"Zombie processes created: {initial_zombies} -> {final_zombies}")
 
 
+def _build_wav(sample_rate=16000, channels=1, bits_per_sample=16, audio_format=1,
+               data=b'\x00' * 64, data_size=None, extra_chunks=b''):
+    """Build a WAV file with the given fmt fields and a matching RIFF size
+    
+    Args:
+        sample_rate: Sample rate written to the fmt chunk
+        channels: Channel count written to the fmt chunk
+        bits_per_sample: Sample width written to the fmt chunk
+        audio_format: Format tag written to the fmt chunk (1 is PCM)
+        data: Sample bytes of the data chunk
+        data_size: Size declared in the data chunk header (defaults to len(data))
+        extra_chunks: Raw chunks inserted between the fmt and data chunks
+        
+    Returns:
+        WAV file bytes
+    """
+    block_align = channels * bits_per_sample // 8
+    fmt = struct.pack('<HHIIHH', audio_format, channels, sample_rate,
+                      sample_rate * block_align, block_align, bits_per_sample)
+    body = (b'WAVE' + b'fmt ' + struct.pack('<I', len(fmt)) + fmt + extra_chunks
+            + b'data' + struct.pack('<I', len(data) if data_size is None else data_size) + data)
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+class TestCanonicalWavDetection(unittest.TestCase):
+    """Test the header check that lets canonical WAV input skip FFmpeg"""
+    
+    def test_canonical_wav_accepted(self):
+        """Test that 16kHz mono 16-bit PCM WAV is recognised"""
+        self.assertTrue(_is_canonical_wav(_build_wav()))
+    
+    def test_extra_chunks_skipped(self):
+        """Test that LIST and odd-sized chunks before the data chunk are skipped"""
+        list_chunk = b'LIST' + struct.pack('<I', 4) + b'INFO'
+        # Odd-sized chunks are followed by a pad byte
+        odd_chunk = b'junk' + struct.pack('<I', 3) + b'abc' + b'\x00'
+        self.assertTrue(_is_canonical_wav(_build_wav(extra_chunks=list_chunk + odd_chunk)))
+    
+    def test_truncated_header_rejected(self):
+        """Test that input shorter than a WAV header is rejected"""
+        self.assertFalse(_is_canonical_wav(_build_wav()[:40]))
+        self.assertFalse(_is_canonical_wav(b'RIFF' + b'\x00' * 100))
+    
+    def test_riff_size_mismatch_rejected(self):
+        """Test that a RIFF size not matching the buffer length is rejected"""
+        self.assertFalse(_is_canonical_wav(_build_wav() + b'\x00' * 4))
+    
+    def test_data_size_past_buffer_rejected(self):
+        """Test that a data chunk claiming more bytes than present is rejected"""
+        self.assertFalse(_is_canonical_wav(_build_wav(data_size=1024)))
+    
+    def test_non_canonical_format_rejected(self):
+        """Test that any other rate, channel count, width or format tag is rejected"""
+        cases = [
+            {'sample_rate': 8000},
+            {'channels': 2},
+            {'bits_per_sample': 8},
+            {'audio_format': 3},
+        ]
+        for fields in cases:
+            with self.subTest(**fields):
+                self.assertFalse(_is_canonical_wav(_build_wav(**fields)))
+    
+    def test_empty_data_rejected(self):
+        """Test that a data chunk of size 0 is rejected"""
+        self.assertFalse(_is_canonical_wav(_build_wav(data=b'')))
+
+
 class TestFFmpegIntegration(unittest.TestCase):
     """Integration tests with actual FFmpeg commands"""
     
@@ -3,7 +3,6 @@
 
 import sys
 import os
-import time
 import logging
 from unittest import mock
 
@@ -46,92 +45,74 @@ def validate_fix():
     logger.info("=" * 60)
     
     # Replace engines with mock
-    for engine_name in STTEngineManager.ENGINES:
-        STTEngineManager.ENGINES[engine_name] = MockEngine
+    engines = STTEngineManager.ENGINES
+    engines.update(dict.fromkeys(engines, MockEngine))
     
-    # Add test engines
-    for i in range(20):
-        STTEngineManager.ENGINES[f'test_{i}'] = MockEngine
+    # Register all names up front so the registry is stable while engines are requested
+    names = [f'test_{i}' for i in range(20)]
+    engines.update(dict.fromkeys(names, MockEngine))
     
-    config = {'initialize_all': False}
-    for i in range(20):
-        config[f'test_{i}'] = {'name': f'test_{i}'}
+    config = {'initialize_all': False, **{name: {'name': name} for name in names}}
     
     manager = STTEngineManager(default_engine='whisper', config=config)
-    manager._lock_cleanup_interval = 1  # 1 second for quick testing
     manager.engines.clear()  # Clear pre-initialized
     
-    # Test 1: Check cleanup mechanism exists
-    logger.info("\n1. Checking cleanup mechanism attributes...")
-    assert hasattr(manager, '_cleanup_unused_locks'), "Missing cleanup method"
-    assert hasattr(manager, '_lock_last_used'), "Missing TTL tracking"
-    assert hasattr(manager, '_lock_refs'), "Missing weak references"
+    # Test 1: Check striping mechanism exists
+    logger.info("\n1. Checking lock striping attributes...")
+    assert hasattr(manager, '_engine_lock_stripes'), "Missing lock stripes"
+    assert hasattr(manager, '_get_or_create_lock'), "Missing lock lookup"
     assert hasattr(manager, 'get_lock_stats'), "Missing monitoring method"
-    logger.info("   ✓ All cleanup attributes present")
+    logger.info("   ✓ All striping attributes present")
     
-    # Test 2: Create locks through lazy initialization
-    logger.info("\n2. Creating locks through lazy initialization...")
+    # Test 2: Initialize engines through their stripe locks
+    logger.info("\n2. Initializing engines lazily...")
     for i in range(10):
         engine = manager.get_engine(f'test_{i}')
     
-    initial_locks = len(manager._engine_locks)
-    logger.info(f"   Created {initial_locks} locks")
-    assert initial_locks == 10, f"Expected 10 locks, got {initial_locks}"
+    initial_locks = manager.get_lock_stats()['total_locks']
+    logger.info(f"   Lock pool size: {initial_locks}")
+    assert initial_locks == manager._LOCK_STRIPES, f"Expected {manager._LOCK_STRIPES} locks, got {initial_locks}"
     
-    # Test 3: Verify TTL tracking
-    logger.info("\n3. Verifying TTL tracking...")
+    # Test 3: Verify stripe mapping
+    logger.info("\n3. Verifying stripe mapping...")
     stats = manager.get_lock_stats()
     for i in range(10):
         assert f'test_{i}' in stats['locks'], f"Missing lock for test_{i}"
-        age = stats['locks'][f'test_{i}']['age_seconds']
-        assert age >= 0, "Invalid age tracking"
-    logger.info("   ✓ TTL tracking working")
-    
-    # Test 4: Test cleanup
-    logger.info("\n4. Testing cleanup mechanism...")
-    time.sleep(manager._lock_cleanup_interval + 0.5)
-    manager._cleanup_unused_locks()
-    
-    locks_after_cleanup = len(manager._engine_locks)
-    logger.info(f"   Locks after cleanup: {locks_after_cleanup}")
-    assert locks_after_cleanup < initial_locks, "Cleanup didn't remove any locks"
-    logger.info("   ✓ Cleanup successfully removed unused locks")
-    
-    # Test 5: Verify we can still get engines after cleanup
-    logger.info("\n5. Testing engine access after cleanup...")
+        stripe = stats['locks'][f'test_{i}']['stripe']
+        assert 0 <= stripe < manager._LOCK_STRIPES, "Invalid stripe index"
+        assert manager._get_or_create_lock(f'test_{i}') is manager._engine_lock_stripes[stripe]
+    logger.info("   ✓ Stripe mapping stable")
+    
+    # Test 4: Verify we can still get engines
+    logger.info("\n4. Testing repeated engine access...")
     for i in range(5):
         engine = manager.get_engine(f'test_{i}')
-        assert engine is not None, f"Failed to get test_{i} after cleanup"
-    logger.info("   ✓ Engines accessible after cleanup")
+        assert engine is not None, f"Failed to get test_{i}"
+    logger.info("   ✓ Engines accessible")
     
-    # Test 6: Verify no indefinite growth
-    logger.info("\n6. Testing no indefinite lock growth...")
+    # Test 5: Verify no indefinite growth
+    logger.info("\n5. Testing no indefinite lock growth...")
     
     # Request many different engines
     for i in range(20):
         engine = manager.get_engine(f'test_{i}')
     
-    # Wait and cleanup
-    time.sleep(manager._lock_cleanup_interval + 0.5)
-    manager._cleanup_unused_locks()
-    
-    # Request again
-    for i in range(20):
-        engine = manager.get_engine(f'test_{i}')
+    # Look up locks for many unseen names
+    for i in range(1000):
+        manager._get_or_create_lock(f'unseen_{i}')
     
-    final_locks = len(manager._engine_locks)
+    final_locks = manager.get_lock_stats()['total_locks']
     logger.info(f"   Final lock count: {final_locks}")
-    assert final_locks <= 20, f"Lock count grew beyond expected: {final_locks}"
+    assert final_locks == initial_locks, f"Lock count grew beyond expected: {final_locks}"
     logger.info("   ✓ No indefinite lock growth")
     
     logger.info("\n" + "=" * 60)
     logger.info("✅ SUCCESS: ENGINE LOCK LEAK FIX VALIDATED")
     logger.info("=" * 60)
     logger.info("\nThe fix successfully implements:")
-    logger.info("• TTL-based cleanup of unused locks")
-    logger.info("• Weak reference tracking")
-    logger.info("• Thread-safe cleanup mechanism")
-    logger.info("• Lock recreation after cleanup")
+    logger.info("• A fixed pool of lock stripes")
+    logger.info("• Stable engine-name to stripe mapping")
+    logger.info("• No cleanup pass racing active locks")
     logger.info("• Monitoring via get_lock_stats()")
     logger.info("\nThis prevents memory leaks in long-running deployments.")
     